@@ -144,6 +144,8 @@ class DownloadWorker(QObject):
             self.process_lolesxi_zip()
             self.status_update.emit("Processing drivers file...")
             self.process_drivers_file()
+            self.status_update.emit("Processing report assets...")
+            self.process_report_assets()
             self.status_update.emit("Cleaning up temporary files...")
             self.cleanup_files(downloaded_files)
             self.progress.emit(100)
@@ -465,10 +467,11 @@ class DownloadWorker(QObject):
             logger.info("Successfully copied %s YAML files from %s found to %s", copied_count, len(yaml_files), artifacts_dir)
             remove_tree_safe(temp_extract)
             try:
-                if "helper.artifacts" in sys.modules:
-                    artifacts_module = sys.modules['helper.artifacts']
+                if "helper.resources.artifacts" in sys.modules:
+                    artifacts_module = sys.modules['helper.resources.artifacts']
                     if hasattr(artifacts_module, 'ARTIFACTS_DATA_CACHE'):
                         artifacts_module.ARTIFACTS_DATA_CACHE = None
+                        artifacts_module.ARTIFACTS_CATEGORIES_CACHE = None
                         logger.info("Cleared artifacts data cache")
             except Exception as e:
                 logger.warning("Could not clear artifacts cache: %s", e)
@@ -572,10 +575,11 @@ class DownloadWorker(QObject):
             logger.info("Successfully copied %s YML files from %s found to %s", copied_count, len(yml_files), hijacklib_dir)
             remove_tree_safe(temp_extract)
             try:
-                if "helper.hijacklibs" in sys.modules:
-                    hijacklibs_module = sys.modules['helper.hijacklibs']
+                if "helper.resources.hijacklibs" in sys.modules:
+                    hijacklibs_module = sys.modules['helper.resources.hijacklibs']
                     if hasattr(hijacklibs_module, 'HIJACKLIBS_DATA_CACHE'):
                         hijacklibs_module.HIJACKLIBS_DATA_CACHE = None
+                        hijacklibs_module.HIJACKLIBS_VENDORS_CACHE = None
                         logger.info("Cleared hijacklibs data cache")
             except Exception as e:
                 logger.warning("Could not clear hijacklibs cache: %s", e)
@@ -760,6 +764,28 @@ class DownloadWorker(QObject):
         except Exception as e:
             logger.error("Error processing drivers file: %s", e)
     
+    def process_report_assets(self):
+        asset_files = [Path("vis-network.min.js"), Path("inter-latin-wght-normal.woff2")]
+        try:
+            assets_dir = Path("data/report_assets").resolve()
+            assets_dir.mkdir(parents=True, exist_ok=True)
+            for asset_file in asset_files:
+                if not asset_file.exists():
+                    logger.warning("Report asset %s does not exist, skipping.", asset_file)
+                    continue
+                dest_file = assets_dir / asset_file.name
+                shutil.copy2(asset_file, dest_file)
+                os.chmod(dest_file, 0o644)
+                logger.info("Successfully copied %s to %s", asset_file, dest_file)
+            try:
+                if "helper.reporting.html_exporter" in sys.modules:
+                    sys.modules["helper.reporting.html_exporter"].read_report_asset.cache_clear()
+                    logger.info("Cleared report asset cache")
+            except Exception as e:
+                logger.warning("Could not clear report asset cache: %s", e)
+        except Exception as e:
+            logger.error("Error processing report assets: %s", e)
+    
     def cleanup_files(self, file_list):
         for file_to_delete in file_list:
             try:
@@ -5,14 +5,18 @@ summary. Cross-platform (Windows, macOS, Linux). Revised on 01/02/2026 by Jinto
 """
 
 import base64
+import hashlib
 import html as html_module
 import json
 import logging
 import re
+import shutil
 import warnings
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
 
 import markdown
 import openpyxl
@@ -32,6 +36,26 @@ SHEET_DISPLAY_NAMES = {
     "VERIS": "VERIS (Vocabulary for Event Recording and Incident Sharing)",
 }
 IOC_DEFANG_TYPES = frozenset(("ipaddress", "url", "domainname", "emailaddress"))
+# Local copies of the report's web assets, fetched by Download Updates (helper/download_links.yaml).
+REPORT_ASSETS_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "report_assets"
+VIS_NETWORK_ASSET = "vis-network.min.js"
+INTER_FONT_ASSET = "inter-latin-wght-normal.woff2"
+VIS_NETWORK_CDN_TAG = '<script src="https://unpkg.com/vis-network/standalone/umd/vis-network.min.js"></script>'
+# Bytes read per step when Base64-encoding an image; a multiple of 3 so chunks encode without padding.
+IMAGE_B64_CHUNK = 3 * 64 * 1024
+INTER_FONT_CDN_TAG = '<link rel="preconnect" href="https://fonts.googleapis.com">\n    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">'
+
+
+@lru_cache(maxsize=None)
+def read_report_asset(name: str) -> Optional[bytes]:
+    asset_path = REPORT_ASSETS_DIR / name
+    if not asset_path.is_file():
+        return None
+    try:
+        return asset_path.read_bytes()
+    except OSError as e:
+        logger.warning("Could not read report asset %s: %s", asset_path, e)
+        return None
 
 
 def _lighten_hex(hex_color: str, mix_white: float = 0.88) -> str:
@@ -53,6 +77,49 @@ def _lighten_hex(hex_color: str, mix_white: float = 0.88) -> str:
 
 class HTMLExporter:
 
+    def __init__(self, embed_images: bool = True, offline: bool = True):
+        self.embed_images = embed_images
+        self.offline = offline
+        self.assets_dir: Optional[Path] = None
+        self.linked_assets: Dict[Path, str] = {}
+
+    def vis_network_script_tag(self) -> str:
+        script = read_report_asset(VIS_NETWORK_ASSET) if self.offline else None
+        if not script:
+            return VIS_NETWORK_CDN_TAG
+        return "<script>%s</script>" % script.decode("utf-8").replace("</script", "<\\/script")
+
+    def inter_font_tag(self) -> str:
+        font = read_report_asset(INTER_FONT_ASSET) if self.offline else None
+        if not font:
+            return INTER_FONT_CDN_TAG
+        font_b64 = base64.b64encode(font).decode("ascii")
+        return (
+            "<style>@font-face { font-family: 'Inter'; font-style: normal; font-weight: 100 900; "
+            "font-display: swap; src: url(data:font/woff2;base64,%s) format('woff2'); }</style>" % font_b64
+        )
+
+    def image_src(self, image_path: Path, mime_type: str) -> str:
+        """Return an <img> src for image_path: a Base64 data URL, or a relative link into the assets dir."""
+        if self.assets_dir is None:
+            # Encode chunk by chunk so the raw image is never held in memory next to its encoding.
+            encoded = bytearray(b"data:%s;base64," % mime_type.encode("ascii"))
+            with open(image_path, "rb") as fp:
+                for chunk in iter(lambda: fp.read(IMAGE_B64_CHUNK), b""):
+                    encoded += base64.b64encode(chunk)
+            return encoded.decode("ascii")
+        source = image_path.resolve()
+        name = self.linked_assets.get(source)
+        if name is None:
+            # Keyed by the source path: images with the same basename in different folders
+            # get distinct files, and every export re-copies so edited images are picked up.
+            digest = hashlib.blake2b(str(source).encode("utf-8"), digest_size=6).hexdigest()
+            name = "%s-%s%s" % (image_path.stem, digest, image_path.suffix)
+            self.assets_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, self.assets_dir / name)
+            self.linked_assets[source] = name
+        return "%s/%s" % (quote(self.assets_dir.name), quote(name))
+
     def get_sheet_display_name(self, sheet_name: str) -> str:
         sheet_lower = sheet_name.lower()
         for key, display_name in SHEET_DISPLAY_NAMES.items():
@@ -217,10 +284,10 @@ class HTMLExporter:
                 diamond_path = candidate
         if diamond_path:
             try:
-                img_b64 = base64.b64encode(diamond_path.read_bytes()).decode("ascii")
+                diamond_src = self.image_src(diamond_path, "image/jpeg")
                 center_html = (
                     '<div class="diamond-model-center diamond-model-center--image">'
-                    f'<img src="data:image/jpeg;base64,{img_b64}" alt="Diamond" />'
+                    f'<img src="{diamond_src}" alt="Diamond" />'
                     '</div>'
                 )
             except Exception as e:
@@ -289,10 +356,9 @@ class HTMLExporter:
                         abs_path = Path(img_path)
                     if abs_path.is_file():
                         try:
-                            img_data = base64.b64encode(abs_path.read_bytes()).decode("utf-8")
                             ext = abs_path.suffix.lower()
                             mime_type = "image/png" if ext == ".png" else "image/jpeg" if ext in [".jpg", ".jpeg"] else "image/gif" if ext == ".gif" else "image/png"
-                            return '<img src="data:%s;base64,%s" alt="%s" />' % (mime_type, img_data, alt_text)
+                            return '<img src="%s" alt="%s" />' % (self.image_src(abs_path, mime_type), alt_text)
                         except Exception as e:
                             logger.warning("Could not embed image %s: %s", abs_path, e)
                             return '<img src="file:///%s" alt="%s" />' % (abs_path.as_posix(), alt_text)
@@ -300,7 +366,7 @@ class HTMLExporter:
                     return "<p><em>Image not found: %s</em></p>" % img_path
                 html_content = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', replace_image, html_content)
                 def replace_img_src(match):
-                    quote = match.group(1)
+                    quote_char = match.group(1)
                     src = match.group(2).strip()
                     if src.startswith(("http://", "https://", "data:")):
                         return match.group(0)
@@ -313,10 +379,9 @@ class HTMLExporter:
                         logger.warning("Image file not found for embed: %s", abs_path)
                         return match.group(0)
                     try:
-                        img_data = base64.b64encode(abs_path.read_bytes()).decode("utf-8")
                         ext = abs_path.suffix.lower()
                         mime = "image/png" if ext == ".png" else "image/jpeg" if ext in [".jpg", ".jpeg"] else "image/gif" if ext == ".gif" else "image/webp" if ext == ".webp" else "image/png"
-                        return "src=%sdata:%s;base64,%s%s" % (quote, mime, img_data, quote)
+                        return "src=%s%s%s" % (quote_char, self.image_src(abs_path, mime), quote_char)
                     except Exception as e:
                         logger.warning("Could not embed image as base64: %s - %s", abs_path, e)
                         return match.group(0)
@@ -370,8 +435,11 @@ class HTMLExporter:
                         logger.warning("Could not load workbook for visualizations: %s", e)
                         workbook = None
             template_type = report_data.get("html_template", template)
-            html_content = self.build_html(report_data, workbook, template_type)
             output_path_obj = Path(output_path)
+            if not self.embed_images:
+                self.assets_dir = output_path_obj.parent / ("%s_assets" % output_path_obj.stem)
+                self.linked_assets = {}
+            html_content = self.build_html(report_data, workbook, template_type)
             output_dir = output_path_obj.parent
             if output_dir and not output_dir.exists():
                 output_dir.mkdir(parents=True, exist_ok=True)
@@ -417,7 +485,7 @@ class HTMLExporter:
             container_class += " report-full-width"
         
         if report_font == "Inter":
-            font_link = '<link rel="preconnect" href="https://fonts.googleapis.com">\n    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">'
+            font_link = self.inter_font_tag()
             font_family = "'Inter', 'Segoe UI', -apple-system, BlinkMacSystemFont, 'Helvetica Neue', Arial, sans-serif"
         else:
             font_link = ""
@@ -513,20 +581,18 @@ class HTMLExporter:
         timeline_path = Path(timeline_image_path) if timeline_image_path else None
         if timeline_path and timeline_path.is_file():
             try:
-                img_data = base64.b64encode(timeline_path.read_bytes()).decode("utf-8")
                 ext = timeline_path.suffix.lower()
                 mime_type = "image/png" if ext == ".png" else "image/jpeg"
-                timeline_img = "data:%s;base64,%s" % (mime_type, img_data)
+                timeline_img = self.image_src(timeline_path, mime_type)
                 logger.info("Loaded timeline image from: %s", timeline_image_path)
             except Exception as e:
                 logger.warning("Could not load timeline image: %s", e)
         network_path = Path(network_image_path) if network_image_path else None
         if network_path and network_path.is_file():
             try:
-                img_data = base64.b64encode(network_path.read_bytes()).decode("utf-8")
                 ext = network_path.suffix.lower()
                 mime_type = "image/png" if ext == ".png" else "image/jpeg"
-                network_img = "data:%s;base64,%s" % (mime_type, img_data)
+                network_img = self.image_src(network_path, mime_type)
                 logger.info("Loaded network image from: %s", network_image_path)
             except Exception as e:
                 logger.warning("Could not load network image: %s", e)
@@ -535,31 +601,18 @@ class HTMLExporter:
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=UserWarning)
                     db_path = report_data.get("db_path", "") or ""
-                    viz_gen = VisualizationGenerator(workbook, db_path=db_path)
-                    if not timeline_img:
-                        try:
-                            timeline_img = viz_gen.generate_timeline_image()
-                        except Exception as e:
-                            logger.warning("Could not generate timeline image: %s", e)
-                    if not network_img:
-                        try:
-                            network_img = viz_gen.generate_network_image()
-                        except Exception as e:
-                            logger.warning("Could not generate network image: %s", e)
+                    # The dialog's workbook is opened read-write; the generator scans a read-only copy of the file.
+                    viz_gen = VisualizationGenerator(workbook, db_path=db_path,
+                                                     workbook_path=report_data.get("excel_file_name"))
                     try:
-                        network_data = viz_gen.get_network_data()
-                    except Exception as e:
-                        logger.warning("Could not get network data for interactive viz: %s", e)
-                        network_data = None
-                    try:
-                        timeline_data = viz_gen.get_timeline_data()
-                    except Exception as e:
-                        logger.warning("Could not get timeline data for interactive timeline: %s", e)
-                        timeline_data = None
-                    try:
-                        mitre_stats = viz_gen.generate_mitre_statistics()
-                    except Exception as e:
-                        logger.warning("Could not generate MITRE statistics: %s", e)
+                        viz = viz_gen.generate_all(timeline_image=not timeline_img, network_image=not network_img)
+                    finally:
+                        viz_gen.close()
+                    timeline_img = timeline_img or viz["timeline_image"]
+                    network_img = network_img or viz["network_image"]
+                    network_data = viz["network_data"]
+                    timeline_data = viz["timeline_data"]
+                    mitre_stats = viz["mitre_statistics"]
             except Exception as e:
                 logger.exception("Could not initialize visualization generator: %s", e)
         recommendations_content = report_data.get("recommendations_content")
@@ -597,7 +650,7 @@ class HTMLExporter:
         
         timeline_data_json = (json.dumps(timeline_data).replace("</", "<\\/") if timeline_data else None)
         network_data_json = (json.dumps(network_data).replace("</", "<\\/") if network_data else None)
-        vis_network_script = '<script src="https://unpkg.com/vis-network/standalone/umd/vis-network.min.js"></script>' if network_data else ''
+        vis_network_script = self.vis_network_script_tag() if network_data else ''
         
         html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -2217,19 +2270,17 @@ class HTMLExporter:
         timeline_path_debrief = Path(timeline_image_path) if timeline_image_path else None
         if timeline_path_debrief and timeline_path_debrief.is_file():
             try:
-                img_data = base64.b64encode(timeline_path_debrief.read_bytes()).decode("utf-8")
                 ext = timeline_path_debrief.suffix.lower()
                 mime_type = "image/png" if ext == ".png" else "image/jpeg"
-                timeline_img = "data:%s;base64,%s" % (mime_type, img_data)
+                timeline_img = self.image_src(timeline_path_debrief, mime_type)
             except Exception as e:
                 logger.warning("Could not load timeline image: %s", e)
         network_path_debrief = Path(network_image_path) if network_image_path else None
         if network_path_debrief and network_path_debrief.is_file():
             try:
-                img_data = base64.b64encode(network_path_debrief.read_bytes()).decode("utf-8")
                 ext = network_path_debrief.suffix.lower()
                 mime_type = "image/png" if ext == ".png" else "image/jpeg"
-                network_img = "data:%s;base64,%s" % (mime_type, img_data)
+                network_img = self.image_src(network_path_debrief, mime_type)
             except Exception as e:
                 logger.warning("Could not load network image: %s", e)
         if enable_visualizations and workbook and (show_timeline_section or show_lateral_section or show_mitre_section):
@@ -2237,34 +2288,22 @@ class HTMLExporter:
                 with warnings.catch_warnings():
                     warnings.filterwarnings('ignore', category=UserWarning)
                     db_path = report_data.get("db_path", "") or ""
-                    viz_gen = VisualizationGenerator(workbook, db_path=db_path)
-                    
-                    if not timeline_img:
-                        try:
-                            timeline_img = viz_gen.generate_timeline_image()
-                        except Exception:
-                            pass
-                    
-                    if not network_img:
-                        try:
-                            network_img = viz_gen.generate_network_image()
-                        except Exception:
-                            pass
-                    
-                    try:
-                        network_data = viz_gen.get_network_data()
-                    except Exception:
-                        network_data = None
-                    
+                    # The dialog's workbook is opened read-write; the generator scans a read-only copy of the file.
+                    viz_gen = VisualizationGenerator(workbook, db_path=db_path,
+                                                     workbook_path=report_data.get("excel_file_name"))
                     try:
-                        mitre_stats = viz_gen.generate_mitre_statistics()
-                    except Exception:
-                        pass
+                        viz = viz_gen.generate_all(timeline_image=not timeline_img, network_image=not network_img)
+                    finally:
+                        viz_gen.close()
+                    timeline_img = timeline_img or viz["timeline_image"]
+                    network_img = network_img or viz["network_image"]
+                    network_data = viz["network_data"]
+                    mitre_stats = viz["mitre_statistics"]
             except Exception:
                 pass
         
         network_data_json = (json.dumps(network_data).replace("</", "<\\/") if network_data else None)
-        vis_network_script = '<script src="https://unpkg.com/vis-network/standalone/umd/vis-network.min.js"></script>' if network_data else ''
+        vis_network_script = self.vis_network_script_tag() if network_data else ''
         recommendations_content = report_data.get("recommendations_content")
         rec_path_debrief = Path(recommendations_file_path) if recommendations_file_path else None
         if recommendations_content is None and rec_path_debrief and rec_path_debrief.is_file():
@@ -2298,7 +2337,7 @@ class HTMLExporter:
         report_font = report_data.get("report_font", "Inter")
         report_color = report_data.get("report_color", "#235AAA")
         if report_font == "Inter":
-            font_link_debrief = '<link rel="preconnect" href="https://fonts.googleapis.com">\n    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">'
+            font_link_debrief = self.inter_font_tag()
             font_family_debrief = "'Inter', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif"
         else:
             font_link_debrief = ""
@@ -5,19 +5,20 @@ Cross-platform (Windows, macOS, Linux). Revised on 01/02/2026 by Jinto Antony
 """
 
 import logging
+import os
 import re
+import sys
 import traceback
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QCheckBox,
-    QColorDialog,
     QComboBox,
     QDialog,
-    QFileDialog,
     QFrame,
     QGroupBox,
     QHBoxLayout,
@@ -47,6 +48,16 @@ REPORT_SECTIONS = [
 ]
 
 
+@lru_cache(maxsize=1)
+def file_dialog_options():
+    # Skip per-file icon probes; only force Qt's own dialog on Linux sessions without a desktop portal.
+    from PySide6.QtWidgets import QFileDialog
+    options = QFileDialog.Option.DontUseCustomDirectoryIcons
+    if sys.platform.startswith("linux") and not os.environ.get("XDG_CURRENT_DESKTOP"):
+        options |= QFileDialog.Option.DontUseNativeDialog
+    return options
+
+
 def parse_markdown_headings(file_path: str, level: int = 2):
     path = Path(file_path) if file_path else None
     if not path or not path.is_file():
@@ -65,7 +76,12 @@ def parse_markdown_headings(file_path: str, level: int = 2):
     return headings
 
 
-def filter_markdown_by_headings(file_path: str, selected_headings: list) -> str:
+def compile_heading_matcher(selected_headings: list):
+    alternation = "|".join(re.escape(h.strip()) for h in selected_headings)
+    return re.compile(r"^##[ \t]+(?:%s)[ \t]*$" % alternation, re.MULTILINE)
+
+
+def filter_markdown_by_headings(file_path: str, selected_headings: list, matcher=None) -> str:
     path = Path(file_path) if file_path else None
     if not path or not path.is_file():
         return ""
@@ -76,54 +92,60 @@ def filter_markdown_by_headings(file_path: str, selected_headings: list) -> str:
         return ""
     if not selected_headings:
         return ""
-    selected_set = {h.strip() for h in selected_headings}
+    if matcher is None:
+        matcher = compile_heading_matcher(selected_headings)
     parts = re.split(r'\n(?=^##\s+)', content, flags=re.MULTILINE)
     result = []
     for part in parts:
         part = part.rstrip()
         if not part:
             continue
-        if part.startswith("## "):
-            first_line = part.split("\n", 1)[0]
-            heading_text = first_line[3:].strip()
-            if heading_text in selected_set:
-                result.append(part)
+        if part.startswith("## ") and matcher.match(part):
+            result.append(part)
     return "\n\n".join(result) if result else ""
 
 
-def extract_markdown_section_by_heading(file_path: str, heading_text: str) -> str:
+def extract_markdown_section_streaming(file_path: str, heading_text: str) -> str:
     path = Path(file_path) if file_path else None
     if not path or not path.is_file():
         return ""
+    heading_lower = heading_text.strip().lower()
+    heading_pattern = re.compile(r"^(#+)\s+(.+)$")
+    section_level = None
+    result = []
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        with path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                line = line.rstrip("\r\n")
+                m = heading_pattern.match(line.strip())
+                if section_level is None:
+                    if m and m.group(2).strip().lower() == heading_lower:
+                        section_level = len(m.group(1))
+                    continue
+                if m and len(m.group(1)) <= section_level:
+                    break
+                result.append(line)
     except Exception as e:
         logger.warning("Could not read file for Case Summary: %s", e)
         return ""
-    heading_lower = heading_text.strip().lower()
-    in_section = False
-    result = []
-    heading_pattern = re.compile(r"^#+\s+(.+)$")
-    for line in lines:
-        m = heading_pattern.match(line.strip())
-        if m:
-            current_heading = m.group(1).strip().lower()
-            if current_heading == heading_lower:
-                in_section = True
-                continue
-            if in_section:
-                break
-        elif in_section:
-            result.append(line)
     return "\n".join(result).strip() if result else ""
 
 
+def recommendations_file_key(file_path):
+    """(path, mtime_ns) of a recommendations file, so an edited file gets a freshly parsed dialog."""
+    try:
+        return file_path, os.stat(file_path).st_mtime_ns
+    except (OSError, TypeError, ValueError):
+        return file_path, None
+
+
 class RecommendationsSectionDialog(QDialog):
 
     def __init__(self, parent=None, file_path: str = None):
         super().__init__(parent)
         self.setWindowTitle("Choose recommendations to include")
         self.file_path = file_path
+        self.cache_key = recommendations_file_key(file_path)
         self.heading_checkboxes = []
         self.selected_headings = []
         self.setMinimumSize(480, 400)
@@ -195,6 +217,12 @@ class RecommendationsSectionDialog(QDialog):
         for _text, cb in self.heading_checkboxes:
             cb.setChecked(False)
 
+    def reset_selection(self, headings):
+        """Check the boxes for headings (all of them when None), discarding edits from a cancelled run."""
+        wanted = set(headings) if headings is not None else None
+        for text, cb in self.heading_checkboxes:
+            cb.setChecked(wanted is None or text in wanted)
+
     def on_ok(self):
         self.selected_headings = [text for text, cb in self.heading_checkboxes if cb.isChecked()]
         self.accept()
@@ -210,7 +238,9 @@ class ReportSectionsDialog(QDialog):
         self.setWindowTitle("Select Report Sections")
         self.setMinimumSize(420, 380)
         self.initial_selections = initial_selections or {}
-        self.sheet_names = set(sheet_names) if sheet_names else None
+        if sheet_names and not isinstance(sheet_names, (set, frozenset)):
+            sheet_names = set(sheet_names)
+        self.sheet_names = sheet_names or None
         self.section_checkboxes = {}
         self.build_ui()
 
@@ -516,10 +546,16 @@ class ReportBuilderDialog(QDialog):
         self.report_engine = report_engine or ReportEngine()
         self.workbook = workbook
         self.file_path = file_path
+        self._sheet_names_cache = None
         self.recommendations_file_path = None
         self.recommendations_selected_headings = None
+        self._rec_matcher = None
+        self._rec_dialog = None
         self.investigation_summary_file_path = None
+        self._last_browse_dir = str(Path(file_path).parent) if file_path else ""
+        self._default_output_name = "KANVAS_Report_%s.html" % datetime.now().strftime("%Y%m%d_%H%M%S")
         self.report_template_color = "#235AAA"
+        self._color_cached = QColor(self.report_template_color)
         self.section_selections = {}
         self.header_options = {k: True for k in HEADER_OPTION_KEYS}
         self.header_options["confidentiality"] = ""
@@ -559,7 +595,7 @@ class ReportBuilderDialog(QDialog):
         color_layout.addWidget(QLabel("Template color:"))
         self.color_preview = QFrame()
         self.color_preview.setFixedSize(28, 28)
-        self.color_preview.setStyleSheet(f"background-color: {self.report_template_color}; border: 1px solid #ccc; border-radius: 4px;")
+        self.color_preview.setStyleSheet(styles.COLOR_PREVIEW_STYLE.format(c=self.report_template_color))
         self.color_preview.setToolTip(self.report_template_color)
         color_layout.addWidget(self.color_preview)
         self.color_picker_btn = QPushButton("Choose Color...")
@@ -663,12 +699,19 @@ class ReportBuilderDialog(QDialog):
         output_path_layout.addWidget(self.output_path_input, 1)
         output_path_layout.addWidget(browse_button)
         output_layout.addLayout(output_path_layout)
+        self.embed_images_checkbox = QCheckBox("Embed images in the report (Base64)")
+        self.embed_images_checkbox.setChecked(True)
+        self.embed_images_checkbox.setToolTip("Uncheck to copy images into a <report name>_assets folder next to the report instead.")
+        output_layout.addWidget(self.embed_images_checkbox)
+        self.offline_checkbox = QCheckBox("Offline report (inline fonts and interactive network library)")
+        self.offline_checkbox.setChecked(True)
+        self.offline_checkbox.setToolTip("Uses the local copies fetched by Download Updates; falls back to the online links when they are missing.")
+        output_layout.addWidget(self.offline_checkbox)
         output_info = QLabel(
             "<b>Notes:</b><ul style='margin: 4px 0 0 0; padding-left: 20px;'>"
-            "<li>The report output will be saved in <b>HTML</b> format. All images used in the report are embedded as Base64.</li>"
+            "<li>The report output will be saved in <b>HTML</b> format. Images are embedded as Base64 unless embedding is unchecked, in which case they are saved to a folder next to the report.</li>"
             "<li>The <b>Incident Timeline visualization</b> and <b>Lateral Movement visualization</b> is automatically generated from the SOD file.</li>"
-            "<li>The report may not display correctly if the following external links are not reachable (fonts and interactive network).</li>"
-            "<li>https://fonts.googleapis.com, https://fonts.gstatic.com, https://unpkg.com/vis-network/standalone/umd/vis-network.min.js </li>"
+            "<li>Offline reports inline the Inter font and the interactive network library downloaded by <b>Download Updates</b>. Without those local copies (or with offline unchecked) the report loads them from fonts.googleapis.com and unpkg.com.</li>"
             "</ul>"
         )
         output_info.setStyleSheet(styles.LABEL_INFO_ITALIC_10PT)
@@ -692,21 +735,27 @@ class ReportBuilderDialog(QDialog):
             QMessageBox.warning(self, "No Workbook", "No Excel workbook loaded. Please load a file first.")
             logger.warning("No workbook available to load sheets for report builder.")
             return
-        sheet_names = set(self.workbook.sheetnames)
+        sheet_names = self._sheet_names()
         for label, sheet_name in REPORT_SECTIONS:
             self.section_selections[label] = sheet_name in sheet_names
     
+    def _sheet_names(self):
+        if self._sheet_names_cache is None:
+            self._sheet_names_cache = frozenset(self.workbook.sheetnames) if self.workbook else frozenset()
+        return self._sheet_names_cache
+    
     def open_report_sections_dialog(self):
         if not self.workbook:
             QMessageBox.warning(self, "No Workbook", "No Excel workbook loaded. Please load a file first.")
             return
+        names = self._sheet_names()
         if not self.section_selections:
             for label, sheet_name in REPORT_SECTIONS:
-                self.section_selections[label] = sheet_name in set(self.workbook.sheetnames)
+                self.section_selections[label] = sheet_name in names
         dialog = ReportSectionsDialog(
             self,
             initial_selections=self.section_selections,
-            sheet_names=self.workbook.sheetnames
+            sheet_names=names
         )
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.section_selections = dialog.get_selections()
@@ -725,9 +774,9 @@ class ReportBuilderDialog(QDialog):
             logger.info("Footer options updated.")
     
     def get_selected_sheets(self):
-        if not self.workbook:
+        if not self.workbook or not self.section_selections:
             return []
-        sheet_names = set(self.workbook.sheetnames)
+        sheet_names = self._sheet_names()
         seen = set()
         result = []
         for label, sheet_name in REPORT_SECTIONS:
@@ -738,18 +787,21 @@ class ReportBuilderDialog(QDialog):
         return result
     
     def browse_recommendations_file(self):
+        from PySide6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Recommendations File",
-            "",
-            "Markdown Files (*.md);;All Files (*)"
+            self._last_browse_dir,
+            "Markdown Files (*.md);;All Files (*)",
+            options=file_dialog_options()
         )
         
         if file_path:
+            self._last_browse_dir = str(Path(file_path).parent)
             self.recommendations_file_path = file_path
             self.recommendations_file_input.setText(file_path)
             logger.info("Selected recommendations file: %s", file_path)
-            self.open_recommendations_section_dialog()
+            self.open_recommendations_section_dialog(rebuild=True)
     
     def choose_recommendations_sections(self):
         path = Path(self.recommendations_file_path) if self.recommendations_file_path else None
@@ -762,27 +814,43 @@ class ReportBuilderDialog(QDialog):
             return
         self.open_recommendations_section_dialog()
     
-    def open_recommendations_section_dialog(self):
-        dlg = RecommendationsSectionDialog(self, self.recommendations_file_path)
+    def open_recommendations_section_dialog(self, rebuild=False):
+        dlg = self._rec_dialog
+        if rebuild or dlg is None or dlg.cache_key != recommendations_file_key(self.recommendations_file_path):
+            if dlg is not None:
+                dlg.deleteLater()
+            dlg = RecommendationsSectionDialog(self, self.recommendations_file_path)
+            self._rec_dialog = dlg
+        else:
+            dlg.reset_selection(self.recommendations_selected_headings)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             self.recommendations_selected_headings = dlg.get_selected_headings()
+            headings = self.recommendations_selected_headings
+            self._rec_matcher = compile_heading_matcher(headings) if headings else None
             logger.info("Recommendations sections selected: %s headings", len(self.recommendations_selected_headings or []))
     
     def clear_recommendations_file(self):
         self.recommendations_file_path = None
         self.recommendations_selected_headings = None
+        self._rec_matcher = None
+        if self._rec_dialog is not None:
+            self._rec_dialog.deleteLater()
+            self._rec_dialog = None
         self.recommendations_file_input.clear()
         logger.info("Cleared recommendations file path.")
     
     def browse_investigation_summary_file(self):
+        from PySide6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Investigation Summary File",
-            "",
-            "Markdown Files (*.md);;All Files (*)"
+            self._last_browse_dir,
+            "Markdown Files (*.md);;All Files (*)",
+            options=file_dialog_options()
         )
         
         if file_path:
+            self._last_browse_dir = str(Path(file_path).parent)
             self.investigation_summary_file_path = file_path
             self.investigation_summary_file_input.setText(file_path)
             logger.info("Selected investigation summary file: %s", file_path)
@@ -793,11 +861,12 @@ class ReportBuilderDialog(QDialog):
         logger.info("Cleared investigation summary file path.")
     
     def pick_report_template_color(self):
-        initial = QColor(self.report_template_color)
-        color = QColorDialog.getColor(initial, self, "Report template color", QColorDialog.ColorDialogOption.DontUseNativeDialog)
-        if color.isValid():
+        from PySide6.QtWidgets import QColorDialog
+        color = QColorDialog.getColor(self._color_cached, self, "Report template color", QColorDialog.ColorDialogOption.DontUseNativeDialog)
+        if color.isValid() and color != self._color_cached:
+            self._color_cached.setRgba(color.rgba())
             self.report_template_color = color.name()
-            self.color_preview.setStyleSheet("background-color: %s; border: 1px solid #ccc; border-radius: 4px;" % self.report_template_color)
+            self.color_preview.setStyleSheet(styles.COLOR_PREVIEW_STYLE.format(c=self.report_template_color))
             self.color_preview.setToolTip(self.report_template_color)
     
     def set_report_font(self, font_name: str):
@@ -805,15 +874,40 @@ class ReportBuilderDialog(QDialog):
         self.font_btn.setText("Font: %s" % font_name)
     
     def browse_output_path(self):
+        from PySide6.QtWidgets import QFileDialog
         extension = "HTML Files (*.html)"
-        default_name = "KANVAS_Report_%s.html" % datetime.now().strftime("%Y%m%d_%H%M%S")
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Report", default_name, extension
+            self, "Save Report", os.path.join(self._last_browse_dir, self._default_output_name), extension,
+            options=file_dialog_options()
         )
         
         if file_path:
+            self._last_browse_dir = str(Path(file_path).parent)
             self.output_path_input.setText(file_path)
     
+    def check_output_writable(self, output_path: str) -> bool:
+        out_path = Path(output_path)
+        existing_dir = out_path.parent
+        while not existing_dir.exists() and existing_dir != existing_dir.parent:
+            existing_dir = existing_dir.parent
+        error = None
+        if not existing_dir.is_dir() or not os.access(existing_dir, os.W_OK):
+            error = "The output folder is not writable:\n%s" % existing_dir
+        elif out_path.parent.exists():
+            existed = out_path.exists()
+            try:
+                with open(out_path, "a", encoding="utf-8"):
+                    pass
+                if not existed:
+                    out_path.unlink()
+            except OSError as e:
+                error = "Cannot write the report to:\n%s\n\n%s" % (output_path, e)
+        if error:
+            logger.warning("Output path check failed for %s: %s", output_path, error)
+            QMessageBox.warning(self, "Output Error", error)
+            return False
+        return True
+    
     def generate_report(self):
         if not self.workbook or not self.file_path:
             QMessageBox.warning(self, "Error", "No Excel file loaded. Please load a file first.")
@@ -823,7 +917,7 @@ class ReportBuilderDialog(QDialog):
         html_template = "detailed"
         report_title = self.report_title_input.text().strip()
         author = self.author_input.text().strip()
-        summary = extract_markdown_section_by_heading(
+        summary = extract_markdown_section_streaming(
             self.investigation_summary_file_path, "Case Summary"
         ) if self.investigation_summary_file_path else ""
         if not summary.strip():
@@ -847,13 +941,16 @@ class ReportBuilderDialog(QDialog):
         if not output_path:
             QMessageBox.warning(self, "Input Error", "Please select an output path.")
             return
+        if not self.check_output_writable(output_path):
+            return
         
         try:
             column_selections = {}
             recommendations_content = None
             if self.recommendations_file_path and self.recommendations_selected_headings is not None:
                 recommendations_content = filter_markdown_by_headings(
-                    self.recommendations_file_path, self.recommendations_selected_headings
+                    self.recommendations_file_path, self.recommendations_selected_headings,
+                    matcher=self._rec_matcher
                 )
             
             success = self.report_engine.generate_report(
@@ -876,7 +973,9 @@ class ReportBuilderDialog(QDialog):
                 header_options=self.header_options,
                 footer_options=self.footer_options,
                 report_font=self.report_font,
-                report_color=self.report_template_color
+                report_color=self.report_template_color,
+                embed_images=self.embed_images_checkbox.isChecked(),
+                offline=self.offline_checkbox.isChecked()
             )
             
             if success:
@@ -6,7 +6,7 @@ workbook data, column selections, and optional visualizations. Cross-platform
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 import pandas as pd
 
@@ -28,6 +28,26 @@ SHEET_DISPLAY_NAMES = {
 }
 
 
+class SheetRowIterator:
+    """Yields (sheet_name, headers, rows) per sheet, reading cell values through iter_rows."""
+
+    def __init__(self, workbook, sheet_names: List[str]):
+        self.workbook = workbook
+        self.sheet_names = sheet_names
+
+    def __iter__(self) -> Iterator[Tuple[str, List[str], Iterator[tuple]]]:
+        available = set(self.workbook.sheetnames)
+        for sheet_name in self.sheet_names:
+            if sheet_name not in available:
+                logger.warning("Sheet '%s' not found in workbook.", sheet_name)
+                continue
+            sheet = self.workbook[sheet_name]
+            rows = sheet.iter_rows(min_col=1, max_col=sheet.max_column, values_only=True)
+            first_row = next(rows, None) or ()
+            headers = [str(value or "Column %s" % col) for col, value in enumerate(first_row, start=1)]
+            yield sheet_name, headers, rows
+
+
 class MarkdownExporter:
 
     def get_sheet_display_name(self, sheet_name: str) -> str:
@@ -137,7 +157,9 @@ class ReportEngine:
                         header_options: Dict[str, bool] = None,
                         footer_options: Dict[str, bool] = None,
                         report_font: str = "Inter",
-                        report_color: str = "#235AAA") -> bool:
+                        report_color: str = "#235AAA",
+                        embed_images: bool = True,
+                        offline: bool = True) -> bool:
         if report_type not in REPORT_TYPES:
             logger.error("Unsupported report type: %s. Only HTML and Markdown are supported.", report_type)
             return False
@@ -166,11 +188,8 @@ class ReportEngine:
                 "enable_visualizations": bool(selected_sheets),
             }
             column_selections = column_selections or {}
-            for sheet_name in selected_sheets:
-                if sheet_name not in workbook.sheetnames:
-                    logger.warning("Sheet '%s' not found in workbook.", sheet_name)
-                    continue
-                df = self.get_sheet_data(workbook, sheet_name)
+            for sheet_name, headers, rows in SheetRowIterator(workbook, selected_sheets):
+                df = self.rows_to_dataframe(sheet_name, headers, rows)
                 if not df.empty:
                     # Compromised Systems: show only rows where Reason for Listing is 'Compromised'
                     if sheet_name == config.SHEET_SYSTEMS and config.COL_REASON_FOR_LISTING in df.columns:
@@ -187,7 +206,7 @@ class ReportEngine:
                         'columns': df.columns.tolist()
                     }
             if report_type == "HTML":
-                exporter = HTMLExporter()
+                exporter = HTMLExporter(embed_images=embed_images, offline=offline)
                 return exporter.export(report_data, output_path, template=report_data.get("html_template", "detailed"))
             if report_type == "Markdown":
                 exporter = MarkdownExporter()
@@ -196,17 +215,17 @@ class ReportEngine:
             logger.exception("Error generating %s report: %s", report_type, e)
             return False
 
-    def get_sheet_data(self, workbook, sheet_name: str) -> pd.DataFrame:
+    def rows_to_dataframe(self, sheet_name: str, headers: List[str], rows) -> pd.DataFrame:
         try:
-            if sheet_name not in workbook.sheetnames:
-                logger.warning("Sheet '%s' not found in workbook.", sheet_name)
-                return pd.DataFrame()
-            sheet = workbook[sheet_name]
-            headers = [str(sheet.cell(row=1, column=col).value or "Column %s" % col) for col in range(1, sheet.max_column + 1)]
-            data = []
-            for row_idx in range(2, sheet.max_row + 1):
-                data.append([sheet.cell(row=row_idx, column=col).value for col in range(1, sheet.max_column + 1)])
-            return pd.DataFrame(data, columns=headers)
+            return pd.DataFrame(list(rows), columns=headers)
         except Exception as e:
             logger.error("Error loading sheet '%s': %s", sheet_name, e)
             return pd.DataFrame()
+
+    def get_sheet_data(self, workbook, sheet_name: str) -> pd.DataFrame:
+        try:
+            for name, headers, rows in SheetRowIterator(workbook, [sheet_name]):
+                return self.rows_to_dataframe(name, headers, rows)
+        except Exception as e:
+            logger.error("Error loading sheet '%s': %s", sheet_name, e)
+        return pd.DataFrame()
@@ -5,24 +5,28 @@ workbook sheets, MITRE statistics, and icon data URLs for vis.js. Cross-platform
 otherwise from helper/system_types.yaml.
 """
 
-import base64
+import binascii
+import html
+import json
 import logging
+import os
+import re
 import tempfile
 import warnings
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import matplotlib
-import matplotlib.pyplot as plt
-import networkx as nx
+import openpyxl
 
 from helper import config
 from helper.system_type import load_icon_mapping_from_db, _load_system_types_from_yaml
 
-matplotlib.use("Agg")
-
 logger = logging.getLogger(__name__)
 
 MAX_TIMELINE_ROWS = 1000
@@ -30,18 +34,75 @@ MAX_NETWORK_ROWS = 500
 TIMELINE_FIG_WIDTH = 14
 TIMELINE_FIG_HEIGHT_PER_ACTIVITY = 0.3
 NETWORK_FIG_SIZE = (14, 10)
+NETWORK_LAYOUT_ITERATIONS = 30
+NETWORK_SFDP_MIN_NODES = 50
 LABEL_MAX_CHARS = 30
 DESC_DISPLAY_MAX = 60
 DESC_DATA_MAX = 300
 SANITIZE_LABEL_MAX = 50
 MITRE_TOP_TECHNIQUES = 20
 NODE_SIZE_VIS = 40
-DPI_SAVE = 150
+# Images are inlined into HTML reports; 96 DPI matches screen resolution and keeps the base64 payload small.
+DPI_SAVE = 96
+EMBED_IMAGE_FORMATS = ("png", "webp")
+WEBP_QUALITY = 85
+TIMELINE_SVG_PX_PER_INCH = 100
 DEFAULT_ICON = "unknown.png"
+_SANITIZE_TABLE = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
+_VISUALIZE_YES = config.VAL_VISUALIZE_YES.lower()
+_IMAGES_DIR = Path(__file__).resolve().parent.parent.parent / "images"
+_DEFAULT_ICON_PATH = _IMAGES_DIR / DEFAULT_ICON
+# Per-user cache dir (never the shared temp dir), so other accounts cannot plant or read cached icons.
+_USER_CACHE_DIR = Path(
+    (os.environ.get("LOCALAPPDATA") if os.name == "nt" else os.environ.get("XDG_CACHE_HOME"))
+    or Path.home() / ".cache"
+) / "kanvas"
+ICON_DISK_CACHE_PATH = _USER_CACHE_DIR / "icon_data_urls.json"
+_DT_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S:%f", "%Y-%m-%d")
+
+_disk_icon_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_disk_icon_cache_dirty = False
+
+
+def _lazy_figure():
+    """Import matplotlib's Figure on first render, with a writable config/font cache dir.
+
+    Figures are built without pyplot, so rendering ignores the app's interactive backend,
+    leaves its open figures alone and is safe from worker threads.
+    """
+    os.environ.setdefault("MPLCONFIGDIR", os.path.join(tempfile.gettempdir(), "kanvas-mpl"))
+    from matplotlib.figure import Figure
+    return Figure
+
+
+@lru_cache(maxsize=4096)
+def _parse_dt_string(value: str) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            return parsed
+    except ValueError:
+        pass
+    for fmt in _DT_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_dt(value: Any) -> Optional[datetime]:
+    """Timeline timestamp from a cell value; timestamps repeat a lot, so string parses are cached."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return _parse_dt_string(value)
+    return None
 
 
+@lru_cache(maxsize=1)
 def _get_icon_mapping_from_yaml() -> Dict[str, str]:
-    """Build normalized system type -> icon_filename from system_types.yaml."""
+    """Build normalized system type -> icon_filename from system_types.yaml (parsed once; treat as read-only)."""
     mapping = {}
     for t in _load_system_types_from_yaml():
         name = t.get("name", "")
@@ -52,54 +113,202 @@ def _get_icon_mapping_from_yaml() -> Dict[str, str]:
     return mapping
 
 
+_ICON_TOKEN_SPLIT = re.compile(r"[\s\-_/.]+")
+_ICON_TOKEN_MIN_LEN = 2
+# Short label tokens are usually site/country codes: "at-vie-01", "ma-cas-01", "de-fra-01" and
+# "se-sto-01" must stay unknown.png. Only tokens and prefixes at least this long may stand in
+# for a longer indexed token; explicit aliases are exempt, so "dc01" still maps to dc.png.
+_ICON_PREFIX_MIN_LEN = 3
+_ICON_ABBREV_MIN_LEN = 4
+# Heuristic tokens that do not appear in system_types.yaml names, plus overrides
+# for tokens shared by several types (e.g. every Server-* type has "server").
+_ICON_TOKEN_ALIASES = {
+    "dc": "server-dc",
+    "domain": "server-dc",
+    "firewall": "gateway-firewall",
+    "palo": "gateway-firewall",
+    "sonicwall": "gateway-firewall",
+    "server": "server-generic",
+}
+
+
+@lru_cache(maxsize=1)
+def _get_icon_token_index() -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """Token -> icon index over system_types.yaml names, plus its keys sorted for prefix lookups."""
+    yaml_mapping = _get_icon_mapping_from_yaml()
+    index: Dict[str, str] = {}
+    for key, icon in yaml_mapping.items():
+        index.setdefault(key, icon)
+        for token in _ICON_TOKEN_SPLIT.split(key):
+            if len(token) >= _ICON_TOKEN_MIN_LEN:
+                index.setdefault(token, icon)
+    for token, key in _ICON_TOKEN_ALIASES.items():
+        index[token] = yaml_mapping.get(key, DEFAULT_ICON)
+    return index, tuple(sorted(index))
+
+
+def clear_icon_mapping_cache() -> None:
+    """Drop the cached system_types.yaml mapping so the next lookup re-reads the file."""
+    _get_icon_mapping_from_yaml.cache_clear()
+    _get_icon_token_index.cache_clear()
+
+
+def _lookup_icon_token(token: str, index: Dict[str, str], sorted_keys: Tuple[str, ...]) -> Optional[str]:
+    icon = index.get(token)
+    if icon:
+        return icon
+    # An indexed token at the start of the label token, e.g. "dc01" -> "dc". Two-letter
+    # prefixes only count when they are explicit aliases.
+    for end in range(len(token) - 1, _ICON_TOKEN_MIN_LEN - 1, -1):
+        prefix = token[:end]
+        if end < _ICON_PREFIX_MIN_LEN and prefix not in _ICON_TOKEN_ALIASES:
+            continue
+        icon = index.get(prefix)
+        if icon:
+            return icon
+    # The label token abbreviates an indexed token, e.g. "data" -> "database".
+    if len(token) < _ICON_ABBREV_MIN_LEN:
+        return None
+    pos = bisect_left(sorted_keys, token)
+    if pos < len(sorted_keys) and sorted_keys[pos].startswith(token):
+        return index[sorted_keys[pos]]
+    return None
+
+
 def _infer_icon_from_label_fallback(label: str) -> str:
     """Last-resort heuristic when no DB/YAML match. Uses system_types.yaml structure only."""
     if not label:
         return DEFAULT_ICON
     lower = label.lower().strip()
-    yaml_mapping = _get_icon_mapping_from_yaml()
-    for key, icon in yaml_mapping.items():
-        if key in lower or lower in key:
+    index, sorted_keys = _get_icon_token_index()
+    icon = index.get(lower)
+    if icon:
+        return icon
+    for token in _ICON_TOKEN_SPLIT.split(lower):
+        if len(token) < _ICON_TOKEN_MIN_LEN:
+            continue
+        icon = _lookup_icon_token(token, index, sorted_keys)
+        if icon:
             return icon
-    if "domain" in lower or "dc" in lower:
-        return yaml_mapping.get("server-dc", DEFAULT_ICON)
-    if "firewall" in lower or "palo" in lower or "sonicwall" in lower:
-        return yaml_mapping.get("gateway-firewall", DEFAULT_ICON)
-    if "server" in lower:
-        return yaml_mapping.get("server-generic", DEFAULT_ICON)
+    # Aliases buried in compound names, e.g. "mailserver".
+    for alias in _ICON_TOKEN_ALIASES:
+        if alias in lower:
+            return index[alias]
     return DEFAULT_ICON
 
 
+def _sanitize(value: Any, limit: Optional[int] = None) -> str:
+    """str(value) with tabs/newlines turned into spaces, optionally cut to limit characters."""
+    text = value if isinstance(value, str) else str(value)
+    if limit is not None:
+        text = text[:limit]
+    return text.translate(_SANITIZE_TABLE)
+
+
+def _is_visualize_yes(value: Any, strip: bool = True) -> bool:
+    """Visualize-column check, equivalent to str(value)[.strip()].lower() == VAL_VISUALIZE_YES without the copies."""
+    if value is None or isinstance(value, bool):
+        return False  # "none" / "true" / "false" never match
+    if not isinstance(value, str):
+        value = str(value)
+    if strip:
+        value = value.strip()
+    return value == _VISUALIZE_YES or (len(value) == len(_VISUALIZE_YES) and value.lower() == _VISUALIZE_YES)
+
+
 def normalize_system_type(st: str) -> str:
     if not st:
         return ""
     return str(st).strip().lower()
 
 
+def _icon_for(node_id: str, icon_mapping: Dict[str, str], mapping_items: Tuple[Tuple[str, str], ...],
+              hostname_to_system_type: Dict[str, str]) -> str:
+    """Icon for a network node: its Systems-sheet type (exact, then partial match), else the label heuristic."""
+    st = hostname_to_system_type.get(node_id)
+    if st:
+        key = normalize_system_type(st)
+        icon = icon_mapping.get(key)
+        if icon:
+            return icon
+        for map_key, icon in mapping_items:
+            if key in map_key or map_key in key:
+                return icon
+    return _infer_icon_from_label_fallback(node_id)
+
+
 def images_dir() -> Path:
-    return Path(__file__).resolve().parent.parent.parent / "images"
+    return _IMAGES_DIR
+
+
+def _load_disk_icon_cache() -> Dict[str, Dict[str, Any]]:
+    """Icon data URLs from earlier runs, keyed by filename with the size/mtime they were encoded from."""
+    global _disk_icon_cache
+    if _disk_icon_cache is None:
+        _disk_icon_cache = {}
+        try:
+            with open(ICON_DISK_CACHE_PATH, "rb") as f:
+                if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                    logger.warning("Ignoring icon cache %s: not owned by the current user", ICON_DISK_CACHE_PATH)
+                    return _disk_icon_cache
+                data = json.load(f)
+            if isinstance(data, dict):
+                _disk_icon_cache = data
+        except (OSError, ValueError):
+            pass
+    return _disk_icon_cache
+
+
+def _save_disk_icon_cache() -> None:
+    """Write the icon cache once after a batch of lookups; a no-op when nothing new was encoded."""
+    global _disk_icon_cache_dirty
+    if not _disk_icon_cache_dirty:
+        return
+    try:
+        ICON_DISK_CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=ICON_DISK_CACHE_PATH.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(_disk_icon_cache, f)
+            os.replace(tmp_path, ICON_DISK_CACHE_PATH)
+            _disk_icon_cache_dirty = False
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug("Could not write icon cache %s: %s", ICON_DISK_CACHE_PATH, e)
 
 
 def icon_to_data_url(icon_filename: str, cache: Optional[Dict[str, str]] = None) -> Optional[str]:
+    global _disk_icon_cache_dirty
     cache = cache if cache is not None else {}
     if icon_filename in cache:
         return cache[icon_filename]
     requested = icon_filename
-    img_dir = images_dir()
-    path = img_dir / icon_filename
+    path = _IMAGES_DIR / icon_filename
     if not path.is_file():
-        fallback = img_dir / DEFAULT_ICON
-        path = fallback if fallback.is_file() else None
-        if path is None:
+        if DEFAULT_ICON in cache:
+            cache[requested] = cache[DEFAULT_ICON]
+            return cache[requested]
+        if not _DEFAULT_ICON_PATH.is_file():
             cache[requested] = None
             return None
         icon_filename = DEFAULT_ICON
-        path = img_dir / icon_filename
+        path = _DEFAULT_ICON_PATH
     try:
-        raw = path.read_bytes()
-        b64 = base64.b64encode(raw).decode("ascii")
-        ext = "png" if icon_filename.lower().endswith(".png") else "jpeg"
-        data_url = f"data:image/{ext};base64,{b64}"
+        stat = path.stat()
+        disk_cache = _load_disk_icon_cache()
+        entry = disk_cache.get(icon_filename)
+        if entry and entry.get("url") and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            data_url = entry["url"]
+        else:
+            raw = path.read_bytes()
+            b64 = binascii.b2a_base64(raw, newline=False).decode("ascii")
+            ext = "png" if icon_filename.lower().endswith(".png") else "jpeg"
+            data_url = f"data:image/{ext};base64,{b64}"
+            disk_cache[icon_filename] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "url": data_url}
+            # Saved by the caller once per batch; rewriting the JSON per miss is quadratic in icons.
+            _disk_icon_cache_dirty = True
         cache[icon_filename] = data_url
         cache[requested] = data_url
         return data_url
@@ -109,15 +318,120 @@ def icon_to_data_url(icon_filename: str, cache: Optional[Dict[str, str]] = None)
         return None
 
 
+def _compute_network_layout(G) -> Dict[Any, Any]:
+    """Node positions for the network image: Graphviz sfdp for larger graphs when available, else spring layout."""
+    import networkx as nx
+    if G.number_of_nodes() > NETWORK_SFDP_MIN_NODES:
+        try:
+            from networkx.drawing.nx_agraph import graphviz_layout
+            return graphviz_layout(G, prog="sfdp")
+        except Exception as e:
+            logger.debug("sfdp layout unavailable, using spring layout: %s", e)
+    return nx.spring_layout(G, k=1, iterations=NETWORK_LAYOUT_ITERATIONS, threshold=1e-3, seed=42)
+
+
+def _render_timeline_svg(activities: List[Tuple[datetime, str, str]]) -> str:
+    """Same layout as the matplotlib timeline, written as SVG markup; activities must be sorted."""
+    width = TIMELINE_FIG_WIDTH * TIMELINE_SVG_PX_PER_INCH
+    plot_height = max(8, len(activities) * TIMELINE_FIG_HEIGHT_PER_ACTIVITY) * TIMELINE_SVG_PX_PER_INCH
+    top = 50
+    height = plot_height + top + 20
+
+    def x_px(x: float) -> float:
+        # matplotlib axes span x = -0.1 .. 1.0
+        return (x + 0.1) / 1.1 * width
+
+    def y_px(y: float) -> float:
+        return top + (1.0 - y) * plot_height
+
+    line_x = x_px(0.1)
+    box_x = x_px(0.11)
+    box_w = x_px(0.41) - box_x
+    box_h = 0.02 * plot_height
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height:.0f}" '
+        f'viewBox="0 0 {width} {height:.0f}" font-family="sans-serif" font-size="11">',
+        f'<rect width="100%" height="100%" fill="white"/>',
+        f'<text x="{width / 2:.1f}" y="30" font-size="19" font-weight="bold" text-anchor="middle">Timeline Visualization</text>',
+        f'<line x1="{line_x:.1f}" y1="{top}" x2="{line_x:.1f}" y2="{top + plot_height:.1f}" stroke="black" stroke-width="2"/>',
+    ]
+    count = len(activities)
+    for i, (dt, desc, mitre) in enumerate(activities):
+        y = y_px(1.0 - (i / count) * 0.9)
+        mitre_clean = html.escape(_sanitize(mitre, LABEL_MAX_CHARS))
+        desc_short = (desc[:DESC_DISPLAY_MAX] + "...") if len(desc) > DESC_DISPLAY_MAX else desc
+        desc_short = html.escape(_sanitize(desc_short))
+        parts.append(
+            f'<circle cx="{line_x:.1f}" cy="{y:.1f}" r="5" fill="blue"/>'
+            f'<text x="{x_px(0.05):.1f}" y="{y:.1f}" fill="red" font-weight="bold" text-anchor="end" '
+            f'dominant-baseline="middle">{dt.strftime("%Y-%m-%d %H:%M:%S")}</text>'
+            f'<rect x="{box_x:.1f}" y="{y - box_h / 2:.1f}" width="{box_w:.1f}" height="{box_h:.1f}" fill="darkorange"/>'
+            f'<text x="{x_px(0.26):.1f}" y="{y:.1f}" fill="white" font-weight="bold" text-anchor="middle" '
+            f'dominant-baseline="middle">{mitre_clean}</text>'
+            f'<text x="{x_px(0.42):.1f}" y="{y:.1f}" dominant-baseline="middle">{desc_short}</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
 class VisualizationGenerator:
 
-    def __init__(self, workbook, output_dir: Optional[str] = None, db_path: Optional[str] = None):
+    # Icon files do not change while Kanvas runs, so encoded icons are shared by every report.
+    icon_cache: Dict[str, Optional[str]] = {}
+
+    def __init__(self, workbook=None, output_dir: Optional[str] = None, db_path: Optional[str] = None,
+                 workbook_path: Optional[str] = None, render_png_fallback: bool = False,
+                 image_format: str = "png"):
+        self._owns_workbook = False
+        if workbook_path and os.path.isfile(workbook_path):
+            try:
+                workbook = openpyxl.load_workbook(workbook_path, read_only=True, data_only=True)
+                self._owns_workbook = True
+            except Exception as e:
+                logger.warning("Could not open %s read-only for visualizations: %s", workbook_path, e)
         self.workbook = workbook
         self.output_dir = output_dir or tempfile.mkdtemp()
         self.db_path = db_path or ""
+        # Reports draw the network with vis.js from get_network_data(); the matplotlib PNG is only a fallback.
+        self.render_png_fallback = render_png_fallback
+        self.image_format = image_format.lower() if image_format and image_format.lower() in EMBED_IMAGE_FORMATS else "png"
         self.generated_images = {}
-        self.icon_cache: Dict[str, str] = {}
         self._icon_mapping: Optional[Dict[str, str]] = None
+        self._timeline_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._header_cache: Dict[str, Tuple[List[str], Dict[str, int]]] = {}
+        self._network_graph_cache: Dict[str, Optional[Tuple[Any, Dict[str, int]]]] = {}
+        self._network_pos_cache: Dict[str, Dict[Any, Any]] = {}
+
+    def close(self) -> None:
+        """Release the read-only workbook (and its zip handle) opened from workbook_path."""
+        if self._owns_workbook and self.workbook is not None:
+            try:
+                self.workbook.close()
+            except Exception as e:
+                logger.debug("Could not close visualization workbook: %s", e)
+            self._owns_workbook = False
+
+    def __del__(self):
+        self.close()
+
+    def _figure_data_url(self, fig) -> str:
+        """Encode a rendered figure as an inline data URL in self.image_format (png or webp)."""
+        fmt = self.image_format
+        save_kwargs: Dict[str, Any] = {}
+        if fmt == "webp":
+            save_kwargs["pil_kwargs"] = {"quality": WEBP_QUALITY, "method": 4}
+        buf = BytesIO()
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=UserWarning)
+            try:
+                fig.savefig(buf, format=fmt, dpi=DPI_SAVE, facecolor="white", **save_kwargs)
+            except ValueError as e:
+                # matplotlib < 3.6 has no webp writer, and WebP caps each side at 16383 px (long timelines)
+                logger.debug("Could not save figure as %s, using png: %s", fmt, e)
+                fmt = "png"
+                buf = BytesIO()
+                fig.savefig(buf, format=fmt, dpi=DPI_SAVE, facecolor="white")
+        return "data:image/%s;base64,%s" % (fmt, binascii.b2a_base64(buf.getvalue(), newline=False).decode("ascii"))
 
     def _get_icon_mapping(self) -> Dict[str, str]:
         """Load icon mapping from DB if available, else from system_types.yaml."""
@@ -129,66 +443,94 @@ class VisualizationGenerator:
             self._icon_mapping = _get_icon_mapping_from_yaml()
         return self._icon_mapping
 
-    def generate_timeline_image(self, sheet_name: Optional[str] = None) -> Optional[str]:
-        sheet_name = sheet_name or config.SHEET_TIMELINE
-        try:
-            if sheet_name not in self.workbook.sheetnames:
-                logger.warning("Sheet '%s' not found for timeline visualization", sheet_name)
-                return None
-            sheet = self.workbook[sheet_name]
-            headers = [cell.value for cell in sheet[1]]
-            headers = [str(h) if h else "Column %s" % (i + 1) for i, h in enumerate(headers)]
-            try:
-                dt_col = headers.index(config.COL_TIMESTAMP)
-                desc_col = headers.index(config.COL_ACTIVITY)
-                mitre_col = headers.index(config.COL_MITRE_TACTIC)
-            except ValueError:
-                logger.warning("Required columns not found for timeline visualization")
-                return None
-            visualize_col = headers.index(config.COL_VISUALIZE) if config.COL_VISUALIZE in headers else None
-            activities = []
-            for row_idx in range(2, min(sheet.max_row + 1, MAX_TIMELINE_ROWS)):
+    def _headers(self, sheet_name: str) -> Tuple[List[str], Dict[str, int]]:
+        """Header row of a sheet and header -> first column index, read once per sheet."""
+        cached = self._header_cache.get(sheet_name)
+        if cached is None:
+            first_row = next(self.workbook[sheet_name].iter_rows(min_row=1, max_row=1, values_only=True), ())
+            headers = [str(h) if h else "Column %s" % (i + 1) for i, h in enumerate(first_row)]
+            index: Dict[str, int] = {}
+            for i, h in enumerate(headers):
+                index.setdefault(h, i)
+            cached = self._header_cache[sheet_name] = (headers, index)
+        return cached
+
+    def _parse_timeline(self, sheet_name: str) -> Optional[Dict[str, Any]]:
+        """Scan the timeline sheet once; shared by the timeline image, timeline data and MITRE statistics."""
+        if sheet_name in self._timeline_cache:
+            return self._timeline_cache[sheet_name]
+        if sheet_name not in self.workbook.sheetnames:
+            return None
+        sheet = self.workbook[sheet_name]
+        column = self._headers(sheet_name)[1].get
+        dt_col = column(config.COL_TIMESTAMP)
+        desc_col = column(config.COL_ACTIVITY)
+        mitre_col = column(config.COL_MITRE_TACTIC)
+        technique_col = column(config.COL_MITRE_TECHNIQUE)
+        visualize_col = column(config.COL_VISUALIZE)
+        event_sys_col = column(config.COL_EVENT_SYSTEM)
+        has_timeline_columns = None not in (dt_col, desc_col, mitre_col)
+        used_cols = [c for c in (dt_col, desc_col, mitre_col, technique_col, visualize_col, event_sys_col) if c is not None]
+        activities = []
+        tactics = []
+        if used_cols:
+            for row_idx, row in enumerate(sheet.iter_rows(min_row=2, min_col=1, max_col=max(used_cols) + 1,
+                                                          values_only=True), start=2):
+                if mitre_col is not None:
+                    tactic_value = row[mitre_col]
+                    if tactic_value and str(tactic_value).strip():
+                        technique = row[technique_col] if technique_col is not None else None
+                        technique = str(technique).strip() if technique and str(technique).strip() else None
+                        tactics.append((str(tactic_value).strip(), technique))
+                if not has_timeline_columns or row_idx >= MAX_TIMELINE_ROWS:
+                    continue
                 try:
-                    if visualize_col is not None:
-                        visualize_val = sheet.cell(row=row_idx, column=visualize_col + 1).value
-                        if str(visualize_val).strip().lower() != config.VAL_VISUALIZE_YES:
-                            continue
-                    dt_val = sheet.cell(row=row_idx, column=dt_col+1).value
-                    desc_val = sheet.cell(row=row_idx, column=desc_col+1).value
-                    mitre_val = sheet.cell(row=row_idx, column=mitre_col+1).value
-                    
+                    if visualize_col is not None and not _is_visualize_yes(row[visualize_col]):
+                        continue
+                    dt_val, desc_val, mitre_val = row[dt_col], row[desc_col], row[mitre_col]
+                    event_sys_val = row[event_sys_col] if event_sys_col is not None else None
                     if not (dt_val and desc_val and mitre_val):
                         continue
-                    
-                    if isinstance(dt_val, datetime):
-                        activity_datetime = dt_val
-                    elif isinstance(dt_val, str):
-                        try:
-                            activity_datetime = datetime.strptime(dt_val, "%Y-%m-%d %H:%M:%S")
-                        except ValueError:
-                            try:
-                                activity_datetime = datetime.strptime(dt_val, "%Y-%m-%d %H:%M:%S.%f")
-                            except ValueError:
-                                try:
-                                    activity_datetime = datetime.strptime(dt_val, "%Y-%m-%d %H:%M:%S:%f")
-                                except ValueError:
-                                    try:
-                                        activity_datetime = datetime.strptime(dt_val, "%Y-%m-%d")
-                                    except ValueError:
-                                        continue
-                    else:
+                    activity_datetime = _parse_dt(dt_val)
+                    if activity_datetime is None:
                         continue
-                    
-                    activities.append((activity_datetime, str(desc_val), str(mitre_val)))
+                    activities.append((activity_datetime, desc_val, mitre_val, event_sys_val))
                 except Exception:
                     continue
+        parsed = {
+            "has_timeline_columns": has_timeline_columns,
+            "activities": activities,
+            "has_tactic_column": mitre_col is not None,
+            "tactics": tactics,
+        }
+        self._timeline_cache[sheet_name] = parsed
+        return parsed
+
+    def generate_timeline_image(self, sheet_name: Optional[str] = None, use_svg: bool = False) -> Optional[str]:
+        """Timeline figure as a data URL; use_svg writes the SVG directly instead of rendering a PNG with matplotlib."""
+        sheet_name = sheet_name or config.SHEET_TIMELINE
+        try:
+            parsed = self._parse_timeline(sheet_name)
+            if parsed is None:
+                logger.warning("Sheet '%s' not found for timeline visualization", sheet_name)
+                return None
+            if not parsed["has_timeline_columns"]:
+                logger.warning("Required columns not found for timeline visualization")
+                return None
+            activities = [(dt, str(desc), str(mitre)) for dt, desc, mitre, _event_sys in parsed["activities"]]
             
             if not activities:
                 logger.warning("No timeline activities found")
                 return None
             activities.sort(key=lambda x: x[0])
+            if use_svg:
+                svg = _render_timeline_svg(activities)
+                return "data:image/svg+xml;base64,%s" % binascii.b2a_base64(svg.encode("utf-8"), newline=False).decode("ascii")
+            Figure = _lazy_figure()
+            from matplotlib.patches import Rectangle
             fig_height = max(8, len(activities) * TIMELINE_FIG_HEIGHT_PER_ACTIVITY)
-            fig, ax = plt.subplots(figsize=(TIMELINE_FIG_WIDTH, fig_height))
+            fig = Figure(figsize=(TIMELINE_FIG_WIDTH, fig_height), layout="constrained")
+            ax = fig.subplots()
             fig.patch.set_facecolor("white")
             ax.set_facecolor("white")
             min_date = activities[0][0]
@@ -207,13 +549,13 @@ class VisualizationGenerator:
                 ax.text(line_x - 0.05, y_pos, timestamp_str, 
                        fontsize=8, ha='right', va='center', color='red', weight='bold',
                        family='sans-serif')
-                mitre_clean = str(mitre).replace("\t", " ").replace("\n", " ").replace("\r", " ")[:LABEL_MAX_CHARS]
-                ax.add_patch(plt.Rectangle((line_x + 0.01, y_pos - 0.01), 0.3, 0.02,
-                                          facecolor='darkorange', edgecolor='none'))
+                mitre_clean = _sanitize(mitre, LABEL_MAX_CHARS)
+                ax.add_patch(Rectangle((line_x + 0.01, y_pos - 0.01), 0.3, 0.02,
+                                       facecolor='darkorange', edgecolor='none'))
                 ax.text(line_x + 0.16, y_pos, mitre_clean, fontsize=8, ha='center', 
                        va='center', color='white', weight='bold', family='sans-serif')
                 desc_short = (desc[:DESC_DISPLAY_MAX] + "...") if len(desc) > DESC_DISPLAY_MAX else desc
-                desc_short = desc_short.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+                desc_short = _sanitize(desc_short)
                 ax.text(line_x + 0.32, y_pos, desc_short, fontsize=8, ha='left', va='center', 
                        family='sans-serif')
             
@@ -221,15 +563,7 @@ class VisualizationGenerator:
             ax.set_ylim(0, 1)
             ax.axis('off')
             ax.set_title('Timeline Visualization', fontsize=14, weight='bold', pad=20, family='sans-serif')
-            plt.tight_layout()
-            buf = BytesIO()
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=UserWarning)
-                plt.savefig(buf, format="png", dpi=DPI_SAVE, bbox_inches="tight", facecolor="white")
-            buf.seek(0)
-            img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-            plt.close(fig)
-            return "data:image/png;base64,%s" % img_base64
+            return self._figure_data_url(fig)
         except Exception as e:
             logger.error("Error generating timeline image: %s", e)
             return None
@@ -237,71 +571,31 @@ class VisualizationGenerator:
     def get_timeline_data(self, sheet_name: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
         sheet_name = sheet_name or config.SHEET_TIMELINE
         try:
-            if sheet_name not in self.workbook.sheetnames:
+            parsed = self._parse_timeline(sheet_name)
+            if parsed is None:
                 logger.warning("Sheet '%s' not found for timeline data", sheet_name)
                 return None
-            sheet = self.workbook[sheet_name]
-            headers = [cell.value for cell in sheet[1]]
-            headers = [str(h) if h else "Column %s" % (i + 1) for i, h in enumerate(headers)]
-            try:
-                dt_col = headers.index(config.COL_TIMESTAMP)
-                desc_col = headers.index(config.COL_ACTIVITY)
-                mitre_col = headers.index(config.COL_MITRE_TACTIC)
-            except ValueError:
+            if not parsed["has_timeline_columns"]:
                 logger.warning("Required columns not found for timeline data")
                 return None
-            visualize_col = headers.index(config.COL_VISUALIZE) if config.COL_VISUALIZE in headers else None
-            event_sys_col = headers.index(config.COL_EVENT_SYSTEM) if config.COL_EVENT_SYSTEM in headers else None
             events: List[Dict[str, Any]] = []
-            for row_idx in range(2, min(sheet.max_row + 1, MAX_TIMELINE_ROWS)):
-                try:
-                    if visualize_col is not None:
-                        visualize_val = sheet.cell(row=row_idx, column=visualize_col + 1).value
-                        if str(visualize_val).strip().lower() != config.VAL_VISUALIZE_YES:
-                            continue
-                    dt_val = sheet.cell(row=row_idx, column=dt_col + 1).value
-                    desc_val = sheet.cell(row=row_idx, column=desc_col + 1).value
-                    mitre_val = sheet.cell(row=row_idx, column=mitre_col + 1).value
-                    event_sys_val = sheet.cell(row=row_idx, column=event_sys_col + 1).value if event_sys_col is not None else None
-                    
-                    if not (dt_val and desc_val and mitre_val):
-                        continue
-                    if isinstance(dt_val, datetime):
-                        activity_datetime = dt_val
-                    elif isinstance(dt_val, str):
-                        try:
-                            activity_datetime = datetime.strptime(dt_val, "%Y-%m-%d %H:%M:%S")
-                        except ValueError:
-                            try:
-                                activity_datetime = datetime.strptime(dt_val, "%Y-%m-%d %H:%M:%S.%f")
-                            except ValueError:
-                                try:
-                                    activity_datetime = datetime.strptime(dt_val, "%Y-%m-%d %H:%M:%S:%f")
-                                except ValueError:
-                                    try:
-                                        activity_datetime = datetime.strptime(dt_val, "%Y-%m-%d")
-                                    except ValueError:
-                                        continue
-                    else:
-                        continue
-                    desc_str = str(desc_val).replace("\t", " ").replace("\n", " ").replace("\r", " ")
-                    mitre_str = str(mitre_val).replace("\t", " ").replace("\n", " ").replace("\r", " ")
-                    short_desc = desc_str if len(desc_str) <= DESC_DATA_MAX else desc_str[:DESC_DATA_MAX - 3] + "..."
-                    event_sys_str = str(event_sys_val).strip() if event_sys_val is not None and str(event_sys_val).strip() else ""
-                    event_sys_str = event_sys_str.replace("\t", " ").replace("\n", " ").replace("\r", " ")[:LABEL_MAX_CHARS]
-                    
-                    events.append(
-                        {
-                            "timestamp": activity_datetime.isoformat(),
-                            "timestamp_display": activity_datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                            "activity": short_desc,
-                            "mitre_tactic": mitre_str,
-                            "event_system": event_sys_str,
-                            "_date": activity_datetime.date(),
-                        }
-                    )
-                except Exception:
-                    continue
+            for activity_datetime, desc_val, mitre_val, event_sys_val in parsed["activities"]:
+                desc_str = _sanitize(desc_val)
+                mitre_str = _sanitize(mitre_val)
+                short_desc = desc_str if len(desc_str) <= DESC_DATA_MAX else desc_str[:DESC_DATA_MAX - 3] + "..."
+                event_sys_str = str(event_sys_val).strip() if event_sys_val is not None and str(event_sys_val).strip() else ""
+                event_sys_str = _sanitize(event_sys_str, LABEL_MAX_CHARS)
+                
+                events.append(
+                    {
+                        "timestamp": activity_datetime.isoformat(),
+                        "timestamp_display": activity_datetime.strftime("%Y-%m-%d %H:%M:%S"),
+                        "activity": short_desc,
+                        "mitre_tactic": mitre_str,
+                        "event_system": event_sys_str,
+                        "_date": activity_datetime.date(),
+                    }
+                )
             if not events:
                 return None
             events.sort(key=lambda e: e["timestamp"])
@@ -319,80 +613,99 @@ class VisualizationGenerator:
             logger.error("Error building timeline data: %s", e)
             return None
 
+    def _build_network_graph(self, sheet_name: str) -> Optional[Tuple[Any, Dict[str, int]]]:
+        """Directed system graph from the sheet's visualized rows, plus the column indices used; built once per sheet."""
+        if sheet_name in self._network_graph_cache:
+            return self._network_graph_cache[sheet_name]
+        self._network_graph_cache[sheet_name] = None
+        if sheet_name not in self.workbook.sheetnames:
+            logger.warning("Sheet '%s' not found for network visualization", sheet_name)
+            return None
+        sheet = self.workbook[sheet_name]
+        header_index = self._headers(sheet_name)[1]
+        required_columns = [config.COL_EVENT_SYSTEM, config.COL_REMOTE_SYSTEM, config.COL_DIRECTION, config.COL_VISUALIZE]
+        column_indices = {}
+        for col_name in required_columns:
+            if col_name in header_index:
+                column_indices[col_name] = header_index[col_name]
+            else:
+                logger.warning("Column '%s' not found for network visualization", col_name)
+                return None
+        import networkx as nx
+        G = nx.DiGraph()
+        visualize_idx = column_indices[config.COL_VISUALIZE]
+        event_idx = column_indices[config.COL_EVENT_SYSTEM]
+        remote_idx = column_indices[config.COL_REMOTE_SYSTEM]
+        direction_idx = column_indices[config.COL_DIRECTION]
+        # Ordered dicts dedupe repeated connections while keeping row order for a stable layout.
+        nodes: Dict[str, None] = {}
+        edges: Dict[Tuple[str, str], None] = {}
+        for row in sheet.iter_rows(min_row=2, max_row=min(sheet.max_row or MAX_NETWORK_ROWS - 1, MAX_NETWORK_ROWS - 1),
+                                   min_col=1, max_col=max(column_indices.values()) + 1, values_only=True):
+            try:
+                if not _is_visualize_yes(row[visualize_idx], strip=False):
+                    continue
+                event_system, remote_system, direction = row[event_idx], row[remote_idx], row[direction_idx]
+                if not (event_system and remote_system and direction):
+                    continue
+                event_system = str(event_system).strip()
+                remote_system = str(remote_system).strip()
+                direction = str(direction).strip()
+                nodes[event_system] = None
+                nodes[remote_system] = None
+                if direction == "->":
+                    edges[(event_system, remote_system)] = None
+                elif direction == "<-":
+                    edges[(remote_system, event_system)] = None
+                elif direction == "<->":
+                    edges[(event_system, remote_system)] = None
+                    edges[(remote_system, event_system)] = None
+            except Exception:
+                continue
+        G.add_nodes_from(nodes)
+        G.add_edges_from(edges)
+        graph = (G, column_indices)
+        self._network_graph_cache[sheet_name] = graph
+        return graph
+
+    def _network_layout(self, sheet_name: str, G) -> Dict[Any, Any]:
+        pos = self._network_pos_cache.get(sheet_name)
+        if pos is None:
+            pos = self._network_pos_cache[sheet_name] = _compute_network_layout(G)
+        return pos
+
     def generate_network_image(self, sheet_name: Optional[str] = None) -> Optional[str]:
+        """Network PNG as a data URL; None when render_png_fallback is off and get_network_data() covers the graph."""
         sheet_name = sheet_name or config.SHEET_TIMELINE
         try:
-            if sheet_name not in self.workbook.sheetnames:
-                logger.warning("Sheet '%s' not found for network visualization", sheet_name)
+            graph = self._build_network_graph(sheet_name)
+            if graph is None:
                 return None
-            sheet = self.workbook[sheet_name]
-            headers = [cell.value for cell in sheet[1]]
-            headers = [str(h) if h else "Column %s" % (i + 1) for i, h in enumerate(headers)]
-            required_columns = [config.COL_EVENT_SYSTEM, config.COL_REMOTE_SYSTEM, config.COL_DIRECTION, config.COL_VISUALIZE]
-            column_indices = {}
-            for col_name in required_columns:
-                if col_name in headers:
-                    column_indices[col_name] = headers.index(col_name)
-                else:
-                    logger.warning("Column '%s' not found for network visualization", col_name)
-                    return None
-            G = nx.DiGraph()
-            for row_idx in range(2, min(sheet.max_row + 1, MAX_NETWORK_ROWS)):
-                try:
-                    visualize_val = sheet.cell(row=row_idx, column=column_indices[config.COL_VISUALIZE] + 1).value
-                    if str(visualize_val).lower() != config.VAL_VISUALIZE_YES:
-                        continue
-                    event_system = sheet.cell(row=row_idx, column=column_indices[config.COL_EVENT_SYSTEM] + 1).value
-                    remote_system = sheet.cell(row=row_idx, column=column_indices[config.COL_REMOTE_SYSTEM] + 1).value
-                    direction = sheet.cell(row=row_idx, column=column_indices[config.COL_DIRECTION] + 1).value
-                    
-                    if not (event_system and remote_system and direction):
-                        continue
-                    
-                    event_system = str(event_system).strip()
-                    remote_system = str(remote_system).strip()
-                    direction = str(direction).strip()
-                    
-                    G.add_node(event_system)
-                    G.add_node(remote_system)
-                    
-                    if direction == "->":
-                        G.add_edge(event_system, remote_system)
-                    elif direction == "<-":
-                        G.add_edge(remote_system, event_system)
-                    elif direction == "<->":
-                        G.add_edge(event_system, remote_system)
-                        G.add_edge(remote_system, event_system)
-                except Exception:
-                    continue
-            
+            G = graph[0]
             if not G.nodes():
                 logger.warning("No network nodes found")
                 return None
-            fig, ax = plt.subplots(figsize=NETWORK_FIG_SIZE)
+            if not self.render_png_fallback:
+                # The same graph yields a non-empty vis.js payload, which the report shows instead of this image.
+                return None
+            import networkx as nx
+            Figure = _lazy_figure()
+            fig = Figure(figsize=NETWORK_FIG_SIZE, layout="constrained")
+            ax = fig.subplots()
             fig.patch.set_facecolor("white")
             ax.set_facecolor("white")
-            pos = nx.spring_layout(G, k=1, iterations=50, seed=42)
+            pos = self._network_layout(sheet_name, G)
             nx.draw_networkx_nodes(G, pos, ax=ax, node_color="lightblue",
                                   node_size=1000, alpha=0.9, edgecolors="black", linewidths=2)
             nx.draw_networkx_edges(G, pos, ax=ax, edge_color="gray",
                                   arrows=True, arrowsize=20, alpha=0.6, width=1.5)
-            labels = {node: str(node).replace("\t", " ").replace("\n", " ").replace("\r", " ")[:LABEL_MAX_CHARS]
-                      for node in G.nodes()}
+            labels = {node: _sanitize(node, LABEL_MAX_CHARS) for node in G.nodes()}
             nx.draw_networkx_labels(G, pos, labels, ax=ax, font_size=8, font_weight='bold', 
                                    font_family='sans-serif')
             
             ax.set_title('Network Visualization', fontsize=14, weight='bold', pad=20, family='sans-serif')
             ax.axis('off')
-            plt.tight_layout()
-            buf = BytesIO()
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=UserWarning)
-                plt.savefig(buf, format="png", dpi=DPI_SAVE, bbox_inches="tight", facecolor="white")
-            buf.seek(0)
-            img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-            plt.close(fig)
-            return "data:image/png;base64,%s" % img_base64
+            return self._figure_data_url(fig)
         except Exception as e:
             logger.error("Error generating network image: %s", e)
             return None
@@ -400,86 +713,40 @@ class VisualizationGenerator:
     def get_network_data(self, sheet_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
         sheet_name = sheet_name or config.SHEET_TIMELINE
         try:
-            if sheet_name not in self.workbook.sheetnames:
+            graph = self._build_network_graph(sheet_name)
+            if graph is None:
                 return None
-            sheet = self.workbook[sheet_name]
-            headers = [cell.value for cell in sheet[1]]
-            headers = [str(h) if h else "Column %s" % (i + 1) for i, h in enumerate(headers)]
-            required_columns = [config.COL_EVENT_SYSTEM, config.COL_REMOTE_SYSTEM, config.COL_DIRECTION, config.COL_VISUALIZE]
-            column_indices = {}
-            for col_name in required_columns:
-                if col_name in headers:
-                    column_indices[col_name] = headers.index(col_name)
-                else:
-                    return None
-            G = nx.DiGraph()
-            for row_idx in range(2, min(sheet.max_row + 1, MAX_NETWORK_ROWS)):
-                try:
-                    visualize_val = sheet.cell(row=row_idx, column=column_indices[config.COL_VISUALIZE] + 1).value
-                    if str(visualize_val).lower() != config.VAL_VISUALIZE_YES:
-                        continue
-                    event_system = sheet.cell(row=row_idx, column=column_indices[config.COL_EVENT_SYSTEM] + 1).value
-                    remote_system = sheet.cell(row=row_idx, column=column_indices[config.COL_REMOTE_SYSTEM] + 1).value
-                    direction = sheet.cell(row=row_idx, column=column_indices[config.COL_DIRECTION] + 1).value
-                    if not (event_system and remote_system and direction):
-                        continue
-                    event_system = str(event_system).strip()
-                    remote_system = str(remote_system).strip()
-                    direction = str(direction).strip()
-                    G.add_node(event_system)
-                    G.add_node(remote_system)
-                    if direction == "->":
-                        G.add_edge(event_system, remote_system)
-                    elif direction == "<-":
-                        G.add_edge(remote_system, event_system)
-                    elif direction == "<->":
-                        G.add_edge(event_system, remote_system)
-                        G.add_edge(remote_system, event_system)
-                except Exception:
-                    continue
+            G = graph[0]
             if not G.nodes():
                 return None
             hostname_to_system_type: Dict[str, str] = {}
             try:
                 if config.SHEET_SYSTEMS in self.workbook.sheetnames:
                     sys_sheet = self.workbook[config.SHEET_SYSTEMS]
-                    sys_headers = [cell.value for cell in sys_sheet[1]]
-                    sys_headers = [str(h) if h else "" for h in sys_headers]
-                    if config.COL_HOSTNAME in sys_headers and config.COL_SYSTEM_TYPE in sys_headers:
-                        host_col = sys_headers.index(config.COL_HOSTNAME) + 1
-                        type_col = sys_headers.index(config.COL_SYSTEM_TYPE) + 1
-                        for r in range(2, min(sys_sheet.max_row + 1, 500)):
-                            host = sys_sheet.cell(row=r, column=host_col).value
-                            st = sys_sheet.cell(row=r, column=type_col).value
+                    sys_index = self._headers(config.SHEET_SYSTEMS)[1]
+                    if config.COL_HOSTNAME in sys_index and config.COL_SYSTEM_TYPE in sys_index:
+                        host_col = sys_index[config.COL_HOSTNAME]
+                        type_col = sys_index[config.COL_SYSTEM_TYPE]
+                        for row in sys_sheet.iter_rows(min_row=2, max_row=min(sys_sheet.max_row or 499, 499), min_col=1,
+                                                       max_col=max(host_col, type_col) + 1, values_only=True):
+                            host, st = row[host_col], row[type_col]
                             if host and st:
                                 hostname_to_system_type[str(host).strip()] = str(st).strip()
             except Exception as e:
                 logger.debug("Could not read Systems sheet for icons: %s", e)
 
             icon_mapping = self._get_icon_mapping()
-
-            def icon_filename_for_node(node_id: str) -> str:
-                st = hostname_to_system_type.get(node_id)
-                if st:
-                    key = normalize_system_type(st)
-                    if key in icon_mapping:
-                        return icon_mapping[key]
-                    for map_key, icon in icon_mapping.items():
-                        if key in map_key or map_key in key:
-                            return icon
-                return _infer_icon_from_label_fallback(node_id)
-            
-            def sanitize(s: str) -> str:
-                return str(s).replace("\t", " ").replace("\n", " ").replace("\r", " ")[:SANITIZE_LABEL_MAX]
+            # DB mappings also carry the original-case names; only the lowercase keys can match a normalized type.
+            mapping_items = tuple((k, v) for k, v in icon_mapping.items() if k == k.lower())
 
             nodes = []
             for n in G.nodes():
-                icon_file = icon_filename_for_node(n)
+                icon_file = _icon_for(n, icon_mapping, mapping_items, hostname_to_system_type)
                 image_url = icon_to_data_url(icon_file, self.icon_cache)
                 node_entry = {
                     "id": n,
-                    "label": sanitize(n),
-                    "title": sanitize(n),
+                    "label": _sanitize(n, SANITIZE_LABEL_MAX),
+                    "title": _sanitize(n, SANITIZE_LABEL_MAX),
                 }
                 if image_url:
                     node_entry["shape"] = "image"
@@ -487,6 +754,7 @@ class VisualizationGenerator:
                     node_entry["size"] = NODE_SIZE_VIS
                     node_entry["brokenImage"] = None
                 nodes.append(node_entry)
+            _save_disk_icon_cache()
             edges = [{"from": u, "to": v, "arrows": "to"} for u, v in G.edges()]
             return {"nodes": nodes, "edges": edges}
         except Exception as e:
@@ -496,42 +764,61 @@ class VisualizationGenerator:
     def generate_mitre_statistics(self, sheet_name: Optional[str] = None) -> Dict[str, Any]:
         sheet_name = sheet_name or config.SHEET_TIMELINE
         try:
-            if sheet_name not in self.workbook.sheetnames:
+            parsed = self._parse_timeline(sheet_name)
+            if parsed is None or not parsed["has_tactic_column"]:
                 return {}
-            sheet = self.workbook[sheet_name]
-            headers = [cell.value for cell in sheet[1]]
-            headers = [str(h) if h else "Column %s" % (i + 1) for i, h in enumerate(headers)]
-            if config.COL_MITRE_TACTIC not in headers:
-                return {}
-            mitre_tactic_index = headers.index(config.COL_MITRE_TACTIC)
-            mitre_techniques_index = headers.index(config.COL_MITRE_TECHNIQUE) if config.COL_MITRE_TECHNIQUE in headers else None
-            tactics_count = {}
-            techniques_count = {}
-            tactics_techniques = {}
-            for row_idx in range(2, sheet.max_row + 1):
-                tactic_value = sheet.cell(row=row_idx, column=mitre_tactic_index + 1).value
-                if tactic_value and str(tactic_value).strip():
-                    tactic = str(tactic_value).strip()
-                    tactics_count[tactic] = tactics_count.get(tactic, 0) + 1
-                    if tactic not in tactics_techniques:
-                        tactics_techniques[tactic] = []
-                    if mitre_techniques_index is not None:
-                        technique = sheet.cell(row=row_idx, column=mitre_techniques_index + 1).value
-                        if technique and str(technique).strip():
-                            technique = str(technique).strip()
-                            techniques_count[technique] = techniques_count.get(technique, 0) + 1
-                            if technique not in tactics_techniques[tactic]:
-                                tactics_techniques[tactic].append(technique)
+            tactics_count = Counter()
+            techniques_count = Counter()
+            # dict keys act as an insertion-ordered set so the report lists
+            # techniques in first-seen order across runs.
+            tactic_technique_sets = defaultdict(dict)
+            for tactic, technique in parsed["tactics"]:
+                tactics_count[tactic] += 1
+                techniques = tactic_technique_sets[tactic]
+                if technique:
+                    techniques_count[technique] += 1
+                    techniques[technique] = None
+            tactics_techniques = {tactic: list(techniques) for tactic, techniques in tactic_technique_sets.items()}
             total_detections = sum(len(techniques) for techniques in tactics_techniques.values())
             return {
                 "total_detections": total_detections,
                 "unique_tactics": len(tactics_count),
                 "unique_techniques": len(techniques_count),
-                "tactics_count": dict(sorted(tactics_count.items(), key=lambda x: x[1], reverse=True)),
-                "techniques_count": dict(sorted(techniques_count.items(), key=lambda x: x[1], reverse=True)[:MITRE_TOP_TECHNIQUES]),
+                "tactics_count": dict(tactics_count.most_common()),
+                "techniques_count": dict(techniques_count.most_common(MITRE_TOP_TECHNIQUES)),
                 "tactics_techniques": tactics_techniques,
             }
         except Exception as e:
             logger.error("Error generating MITRE statistics: %s", e)
             return {}
 
+    def generate_all(self, timeline_image: bool = True, network_image: bool = True) -> Dict[str, Any]:
+        """Everything a report needs from the timeline sheet, rendering the two images concurrently.
+
+        The data methods run first on this thread; they read the workbook and fill the timeline and
+        network caches. The image renders then only touch those caches and their own Figure, so they
+        can share a thread pool (Agg releases the GIL while rasterizing).
+        """
+        results: Dict[str, Any] = {
+            "timeline_data": self.get_timeline_data(),
+            "network_data": self.get_network_data(),
+            "mitre_statistics": self.generate_mitre_statistics(),
+            "timeline_image": None,
+            "network_image": None,
+        }
+        jobs = {}
+        if timeline_image:
+            jobs["timeline_image"] = self.generate_timeline_image
+        if network_image:
+            jobs["network_image"] = self.generate_network_image
+        if not jobs:
+            return results
+        _lazy_figure()
+        # warnings filters are process-wide; one outer context restores them after both renders.
+        with warnings.catch_warnings():
+            with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                futures = {key: pool.submit(job) for key, job in jobs.items()}
+                for key, future in futures.items():
+                    results[key] = future.result()
+        return results
+
@@ -4,14 +4,15 @@ from data/artifacts YAML files, provides search, OS/category filters, and detail
 view. Cross-platform (Windows, macOS, Linux). Revised on 01/02/2026 by Jinto Antony
 """
 
+import html
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import yaml
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QFont, QStandardItem, QStandardItemModel, QSyntaxHighlighter, QTextCharFormat
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QComboBox,
     QDialog,
     QHBoxLayout,
@@ -27,60 +28,142 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 from helper import styles
+from helper.resources.pickle_cache import cache_signature, read_cache, write_cache
+from helper.resources.yaml_loader import load_yaml_documents
 
 logger = logging.getLogger(__name__)
 
 ARTIFACTS_WINDOW = None
+# Published as immutable tuples in one assignment each, so readers never see a half-built list.
 ARTIFACTS_DATA_CACHE = None
-DETAIL_LINE_WIDTH = 78
-DETAIL_BORDER_WIDTH = 77
+ARTIFACTS_CATEGORIES_CACHE = None
+# Parsed artifacts are pickled next to the YAML files; bump the version when the stored layout changes.
+ARTIFACTS_PICKLE_NAME = ".cache.pkl"
+ARTIFACTS_PICKLE_VERSION = 3
+ARTIFACTS_LOAD_WORKERS = 8
+# Quiet period after the last keystroke before the search box re-filters the list.
+SEARCH_DEBOUNCE_MS = 150
+
+
+def _index_artifact(artifact):
+    """Precompute the lowercased search text (name, doc, source paths) and the OS set used by the filters."""
+    paths = (
+        str(path)
+        for source in artifact.get("sources") or []
+        if isinstance(source, dict)
+        for path in (source.get("attributes") or {}).get("paths") or []
+    )
+    artifact["_haystack"] = "\0".join((artifact["name"], str(artifact.get("doc") or ""), *paths)).lower()
+    artifact["_supported_os_set"] = frozenset(artifact.get("supported_os") or ())
+
+
+def _publish_artifacts(artifacts_data):
+    """Freeze the loaded artifacts into the module caches; categories first so they are ready whenever data is."""
+    global ARTIFACTS_DATA_CACHE, ARTIFACTS_CATEGORIES_CACHE
+    data = tuple(artifacts_data)
+    ARTIFACTS_CATEGORIES_CACHE = tuple(sorted({a.get('category', 'Unknown') for a in data}))
+    ARTIFACTS_DATA_CACHE = data
+    return data
 
 
 def load_artifacts_data():
-    global ARTIFACTS_DATA_CACHE
-    if ARTIFACTS_DATA_CACHE is not None:
-        return ARTIFACTS_DATA_CACHE
+    data = ARTIFACTS_DATA_CACHE
+    if data is not None:
+        return data
     artifacts_data = []
     base_dir = Path(__file__).parent.parent.parent
     artifacts_dir = base_dir / "data" / "artifacts"
     try:
         if not artifacts_dir.exists():
             logger.error("Artifacts directory not found: %s", artifacts_dir)
-            return []
+            return ()
         yaml_files = [f for f in artifacts_dir.iterdir() if f.is_file() and f.suffix.lower() in (".yaml", ".yml")]
         logger.info("Found %s YAML files in artifacts directory", len(yaml_files))
         if not yaml_files:
             logger.warning("No YAML files found in artifacts directory.")
-            return []
-        for yaml_path in yaml_files:
-            try:
-                with open(yaml_path, "r", encoding="utf-8") as fp:
-                    content = fp.read()
-                documents = content.split("---")
-                for doc in documents:
-                    doc = doc.strip()
-                    if not doc or doc.startswith("#"):
-                        continue
-                    try:
-                        artifact = yaml.safe_load(doc)
-                        if artifact and ("name" in artifact or "Name" in artifact):
-                            if "Name" in artifact and "name" not in artifact:
-                                artifact["name"] = artifact.pop("Name")
-                            artifact["category"] = yaml_path.stem
-                            artifact["file"] = yaml_path.name
-                            artifacts_data.append(artifact)
-                    except yaml.YAMLError as e:
-                        logger.error("YAML parse error in %s: %s", yaml_path, e)
-                        continue
-            except Exception as e:
-                logger.error("Error loading %s: %s", yaml_path, e)
-                continue
+            return ()
+        signature = cache_signature(ARTIFACTS_PICKLE_VERSION, yaml_files, artifacts_dir)
+        cached = read_cache(artifacts_dir / ARTIFACTS_PICKLE_NAME, signature)
+        if cached is not None:
+            logger.info("Loaded %s artifacts from cache", len(cached))
+            return _publish_artifacts(cached)
+        # Files are read and parsed on worker threads; results come back in yaml_files order.
+        with ThreadPoolExecutor(max_workers=min(ARTIFACTS_LOAD_WORKERS, len(yaml_files))) as pool:
+            parsed_files = list(pool.map(load_yaml_documents, yaml_files))
+        for yaml_path, documents in zip(yaml_files, parsed_files):
+            for artifact in documents:
+                if isinstance(artifact, dict) and ("name" in artifact or "Name" in artifact):
+                    # Downstream code reads only artifact["name"], always a string.
+                    artifact["name"] = str(artifact.get("name", artifact.get("Name", "")))
+                    artifact.pop("Name", None)
+                    artifact["category"] = yaml_path.stem
+                    artifact["file"] = yaml_path.name
+                    _index_artifact(artifact)
+                    artifacts_data.append(artifact)
         logger.info("Loaded %s artifacts from %s files", len(artifacts_data), len(yaml_files))
+        write_cache(artifacts_dir / ARTIFACTS_PICKLE_NAME, signature, artifacts_data)
     except Exception as e:
         logger.error("Error loading artifacts data: %s", e)
     
-    ARTIFACTS_DATA_CACHE = artifacts_data
-    return artifacts_data
+    return _publish_artifacts(artifacts_data)
+
+
+class ArtifactListModel(QAbstractListModel):
+    """Read-only list model over the artifact dicts; names are served on demand instead of copied into items."""
+
+    def __init__(self, artifacts, parent=None):
+        super().__init__(parent)
+        self._artifacts = artifacts
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._artifacts)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._artifacts[index.row()]["name"]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section == 0:
+            return "Name"
+        return None
+
+
+class ArtifactFilterProxyModel(QSortFilterProxyModel):
+    """Filters the static artifact list by search text, OS and category without rebuilding the source model."""
+
+    def __init__(self, artifacts, parent=None):
+        super().__init__(parent)
+        self._artifacts = artifacts
+        self._search_lower = ""
+        self._os_filter = "All"
+        self._category_filter = "All"
+
+    def artifact_at(self, index):
+        """Artifact dict behind a proxy index, or None."""
+        if not index.isValid():
+            return None
+        row = self.mapToSource(index).row()
+        if 0 <= row < len(self._artifacts):
+            return self._artifacts[row]
+        return None
+
+    def set_filters(self, search_text="", os_filter_text="All", category_filter_text="All"):
+        self._search_lower = search_text.strip().lower() if search_text else ""
+        self._os_filter = os_filter_text
+        self._category_filter = category_filter_text
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        artifact = self._artifacts[source_row]
+        # Cheapest rejections first: category equality, OS set membership, then the substring search.
+        if self._category_filter != "All" and artifact.get('category') != self._category_filter:
+            return False
+        if self._os_filter != "All" and self._os_filter not in artifact["_supported_os_set"]:
+            return False
+        if self._search_lower and self._search_lower not in artifact["_haystack"]:
+            return False
+        return True
 
 
 NO_DATA_MSG = "No data found. Please click 'Download Updates' to download the latest files."
@@ -90,28 +173,112 @@ class YAMLHighlighter(QSyntaxHighlighter):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
         key_format = QTextCharFormat()
         key_format.setForeground(QColor("#268bd2"))
         key_format.setFontWeight(QFont.Bold)
-        self.highlighting_rules.append((r'^(\w+):', key_format))
         string_format = QTextCharFormat()
         string_format.setForeground(QColor("#2aa198"))
-        self.highlighting_rules.append((r'["\']([^"\']*)["\']', string_format))
         list_format = QTextCharFormat()
         list_format.setForeground(QColor("#859900"))
-        self.highlighting_rules.append((r'^\s*-\s+', list_format))
         comment_format = QTextCharFormat()
         comment_format.setForeground(QColor("#93a1a1"))
         comment_format.setFontItalic(True)
-        self.highlighting_rules.append((r'#.*$', comment_format))
+        self._key_format = key_format
+        self._string_format = string_format
+        self._list_format = list_format
+        self._comment_format = comment_format
     
     def highlightBlock(self, text):
-        for pattern, fmt in self.highlighting_rules:
-            expression = re.compile(pattern, re.MULTILINE)
-            for match in expression.finditer(text):
-                start, end = match.span()
-                self.setFormat(start, end - start, fmt)
+        # One left-to-right pass: a leading "key:" or "- " marker, then quoted strings and a trailing comment.
+        length = len(text)
+        pos = 0
+        while pos < length and (text[pos].isalnum() or text[pos] == "_"):
+            pos += 1
+        if pos and pos < length and text[pos] == ":":
+            pos += 1
+            self.setFormat(0, pos, self._key_format)
+        else:
+            pos = 0
+            while pos < length and text[pos].isspace():
+                pos += 1
+            if pos + 1 < length and text[pos] == "-" and text[pos + 1].isspace():
+                pos += 2
+                while pos < length and text[pos].isspace():
+                    pos += 1
+                self.setFormat(0, pos, self._list_format)
+            else:
+                pos = 0
+        while pos < length:
+            char = text[pos]
+            if char == "#":
+                self.setFormat(pos, length - pos, self._comment_format)
+                return
+            if char == '"' or char == "'":
+                end = pos + 1
+                while end < length and text[end] != '"' and text[end] != "'":
+                    end += 1
+                if end < length:
+                    self.setFormat(pos, end + 1 - pos, self._string_format)
+                    pos = end + 1
+                    continue
+            pos += 1
+
+
+def _detail_table(rows):
+    """Two-column label/value HTML table; rows are (label, value_html) pairs with empty values skipped."""
+    cells = "".join(
+        f"<tr><th style='{styles.KB_DETAIL_TH_STYLE}'>{label}</th><td style='{styles.KB_DETAIL_TD_STYLE}'>{value}</td></tr>"
+        for label, value in rows
+        if value
+    )
+    return f"<table cellspacing='0' cellpadding='0' style='{styles.KB_DETAIL_TABLE_STYLE}'>{cells}</table>" if cells else ""
+
+
+def _join_escaped(values, sep="<br>"):
+    return sep.join(html.escape(str(value)) for value in values)
+
+
+def _source_html(index, source):
+    """Heading and attribute table for one entry of an artifact's sources list."""
+    attrs = source.get('attributes') or {}
+    rows = [
+        ("OS", _join_escaped(source.get('supported_os') or [], ", ")),
+        ("Paths", _join_escaped(attrs.get('paths') or [])),
+        ("Command", html.escape(str(attrs['cmd'])) if attrs.get('cmd') else ""),
+        ("Arguments", _join_escaped(attrs.get('args') or [], " ") if attrs.get('cmd') else ""),
+        ("Registry Keys", _join_escaped(attrs.get('keys') or [])),
+        ("Registry Values", _join_escaped(f"{kv.get('key')}: {kv.get('value')}" for kv in attrs.get('key_value_pairs') or [])),
+    ]
+    return f"<p style='{styles.KB_DETAIL_SOURCE_STYLE}'>[{index}] Type: {html.escape(str(source.get('type', 'N/A')))}</p>{_detail_table(rows)}"
+
+
+def _render_artifact_html(artifact_data):
+    """Detail view HTML for one artifact, shared by the side panel and the detail dialog."""
+    section = f"<h3 style='{styles.KB_DETAIL_H3_STYLE}'>%s</h3>"
+    parts = [
+        f"<h2 style='{styles.KB_DETAIL_H2_STYLE}'>{html.escape(artifact_data['name'])}</h2>",
+        section % "General Information",
+        _detail_table([
+            ("Aliases", _join_escaped(artifact_data.get('aliases') or [], ", ")),
+            ("Supported OS", _join_escaped(artifact_data.get('supported_os') or [], ", ")),
+        ]),
+    ]
+    if artifact_data.get("doc"):
+        parts += [section % "Description", f"<p>{_join_escaped(artifact_data['doc'].strip().splitlines())}</p>"]
+    if artifact_data.get('sources'):
+        parts.append(section % "Sources")
+        parts.extend(_source_html(i, source) for i, source in enumerate(artifact_data['sources'], 1))
+    if artifact_data.get('urls'):
+        parts += [section % "References", "<ul>" + "".join(f"<li>{html.escape(str(url))}</li>" for url in artifact_data['urls']) + "</ul>"]
+    parts += [
+        section % "Metadata",
+        _detail_table([
+            ("Category", html.escape(str(artifact_data.get('category', 'N/A')))),
+            ("File", html.escape(str(artifact_data.get('file', 'N/A')))),
+        ]),
+    ]
+    return "".join(parts)
+
 
 def show_detailed_view(parent, artifact_data):
     detail_dialog = QDialog(parent)
@@ -133,85 +300,7 @@ def show_detailed_view(parent, artifact_data):
     text_area.setReadOnly(True)
     text_area.setFont(QFont("Consolas", 10) or QFont("Courier New", 10))
     text_area.setStyleSheet(styles.TEXT_EDIT_KB_DETAIL_DIALOG)
-    artifact_name = artifact_data.get("name", artifact_data.get("Name", "Unknown"))
-    content = []
-    content.append("╔" + "═" * DETAIL_LINE_WIDTH + "╗")
-    name_padding = max(0, DETAIL_LINE_WIDTH - (len(artifact_name) + 2))
-    content.append(f"║  <b>{artifact_name}</b>" + " " * name_padding + "║")
-    content.append("╚" + "═" * DETAIL_LINE_WIDTH + "╝")
-    content.append("")
-    content.append("┌─ <b>General Information</b>")
-    if artifact_data.get('aliases'):
-        content.append(f"│  Aliases: {', '.join(artifact_data['aliases'])}")
-    if artifact_data.get('supported_os'):
-        content.append(f"│  Supported OS: {', '.join(artifact_data['supported_os'])}")
-    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-    content.append("")
-    if artifact_data.get("doc"):
-        content.append("┌─ <b>Description</b>")
-        doc = artifact_data["doc"].strip()
-        for line in doc.splitlines():
-            content.append(f"│  {line}")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    if artifact_data.get('sources'):
-        content.append("┌─ <b>Sources</b>")
-        for i, source in enumerate(artifact_data['sources'], 1):
-            content.append(f"│")
-            content.append(f"│  [{i}] Source Details:")
-            content.append(f"│  ┌─ Type: {source.get('type', 'N/A')}")
-            
-            attrs = source.get('attributes', {})
-            has_supported_os = bool(source.get('supported_os'))
-            has_paths = bool(attrs.get('paths'))
-            has_cmd = bool(attrs.get('cmd'))
-            has_keys = bool(attrs.get('keys'))
-            has_key_value_pairs = bool(attrs.get('key_value_pairs'))
-            
-            has_any_attrs = has_paths or has_cmd or has_keys or has_key_value_pairs
-            
-            if has_supported_os:
-                connector = "├" if has_any_attrs else "└"
-                content.append(f"│  {connector}─ OS: {', '.join(source['supported_os'])}")
-            
-            if has_paths:
-                connector = "├" if (has_cmd or has_keys or has_key_value_pairs) else "└"
-                content.append(f"│  {connector}─ Paths:")
-                for path in attrs['paths']:
-                    content.append(f"│  │    • {path}")
-            
-            if has_cmd:
-                connector = "├" if (has_keys or has_key_value_pairs) else "└"
-                content.append(f"│  {connector}─ Command: {attrs['cmd']}")
-                if attrs.get('args'):
-                    content.append(f"│  │    Arguments: {' '.join(attrs['args'])}")
-            
-            if has_keys:
-                connector = "├" if has_key_value_pairs else "└"
-                content.append(f"│  {connector}─ Registry Keys:")
-                for key in attrs['keys']:
-                    content.append(f"│  │    • {key}")
-            
-            if has_key_value_pairs:
-                content.append(f"│  └─ Registry Values:")
-                for kv in attrs['key_value_pairs']:
-                    content.append(f"│       • {kv.get('key')}: {kv.get('value')}")
-            elif not has_any_attrs and not has_supported_os:
-                content.append(f"│  └")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    if artifact_data.get('urls'):
-        content.append("┌─ <b>References</b>")
-        for url in artifact_data['urls']:
-            content.append(f"│  • {url}")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    content.append("┌─ <b>Metadata</b>")
-    content.append(f"│  Category: {artifact_data.get('category', 'N/A')}")
-    content.append(f"│  File: {artifact_data.get('file', 'N/A')}")
-    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-    html_content = "\n".join(content).replace("\n", "<br>")
-    text_area.setHtml(f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>{html_content}</pre>")
+    text_area.setHtml(_render_artifact_html(artifact_data))
     layout.addWidget(text_area)
     close_button = QPushButton("Close")
     close_button.setFixedWidth(100)
@@ -305,12 +394,22 @@ def display_artifacts_kb(parent, db_path):
     tree_view.setRootIsDecorated(False)
     tree_view.setAlternatingRowColors(True)
     tree_view.setSelectionBehavior(QTreeView.SelectRows)
-    tree_view.setSortingEnabled(True)
+    # Single-line names: one row height lets the view lay out only the visible rows.
+    tree_view.setUniformRowHeights(True)
+    tree_view.setWordWrap(False)
+    tree_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
     tree_view.setStyleSheet(styles.TREE_VIEW_KB_STYLE)
     
-    model = QStandardItemModel()
-    model.setHorizontalHeaderLabels(["Name"])
-    tree_view.setModel(model)
+    artifacts = sorted(data, key=lambda x: x["name"])
+    model = ArtifactListModel(artifacts, kb_window)
+    proxy_model = ArtifactFilterProxyModel(artifacts, kb_window)
+    proxy_model.setSourceModel(model)
+    # Attach the fully built model and enable sorting last so the view sorts once instead of per row.
+    tree_view.setUpdatesEnabled(False)
+    tree_view.setModel(proxy_model)
+    tree_view.header().setSortIndicator(0, Qt.AscendingOrder)
+    tree_view.setSortingEnabled(True)
+    tree_view.setUpdatesEnabled(True)
     tree_view.setColumnWidth(0, 300)
     
     splitter.addWidget(tree_view)
@@ -336,162 +435,28 @@ def display_artifacts_kb(parent, db_path):
     footer_layout.addStretch()
     main_layout.addLayout(footer_layout)
     
-    full_data_store = []
-    
-    def filter_artifacts(search_text="", os_filter_text="All", category_filter_text="All"):
-        filtered = []
-        try:
-            artifacts_data = load_artifacts_data()
-            if not artifacts_data:
-                return []
-            
-            search_lower = search_text.strip().lower() if search_text else None
-            for artifact in artifacts_data:
-                if search_lower is not None:
-                    artifact_name = artifact.get("name", artifact.get("Name", ""))
-                    name_match = search_lower in str(artifact_name).lower()
-                    doc_match = search_lower in artifact.get("doc", "").lower()
-                    sources_match = False
-                    for source in artifact.get("sources", []):
-                        attrs = source.get("attributes", {})
-                        for path in attrs.get("paths", []):
-                            if search_lower in str(path).lower():
-                                sources_match = True
-                                break
-                        if sources_match:
-                            break
-                    if not (name_match or doc_match or sources_match):
-                        continue
-                if os_filter_text != "All":
-                    supported_os = artifact.get('supported_os', [])
-                    if os_filter_text not in supported_os:
-                        continue
-                if category_filter_text != "All":
-                    if artifact.get('category') != category_filter_text:
-                        continue
-                
-                filtered.append(artifact)
-        except Exception as e:
-            logger.error("Error filtering artifacts: %s", e)
-        return filtered
-    
-    def populate_tree(search_text="", os_filter_text="All", category_filter_text="All"):
-        nonlocal full_data_store
-        model.removeRows(0, model.rowCount())
-        full_data_store.clear()
-        
-        try:
-            filtered_data = filter_artifacts(search_text, os_filter_text, category_filter_text)
-            
-            if not filtered_data:
-                if not load_artifacts_data():
-                    QMessageBox.information(kb_window, "No Artifacts Data", 
-                        "No artifacts data found. Please ensure the data/artifacts directory exists and contains YAML files.")
-                    return
-            for artifact in sorted(filtered_data, key=lambda x: x.get('name', x.get('Name', ''))):
-                name = str(artifact.get('name', artifact.get('Name', '')))
-                
-                item = QStandardItem(name)
-                model.appendRow(item)
-                full_data_store.append(artifact)
-            
-            logger.info("Displayed %s artifacts, stored %s items for detailed view", len(filtered_data), len(full_data_store))
-        except Exception as e:
-            logger.error("Error populating tree: %s", e)
-            QMessageBox.critical(kb_window, "Error", f"Failed to populate data: {e}")
-    
     def update_display():
         search_text = search_textbox.text()
         os_filter_text = os_filter.currentText()
         category_filter_text = category_filter.currentText()
-        populate_tree(search_text, os_filter_text, category_filter_text)
+        tree_view.setUpdatesEnabled(False)
+        try:
+            proxy_model.set_filters(search_text, os_filter_text, category_filter_text)
+            logger.info("Displayed %s artifacts", proxy_model.rowCount())
+        except Exception as e:
+            logger.error("Error filtering artifacts: %s", e)
+        finally:
+            tree_view.setUpdatesEnabled(True)
     
     def on_item_selected(index):
         try:
-            row = index.row()
-            if 0 <= row < len(full_data_store):
-                artifact_data = full_data_store[row]
-                artifact_name = artifact_data.get("name", artifact_data.get("Name", "N/A"))
-                content = []
-                content.append("╔" + "═" * DETAIL_LINE_WIDTH + "╗")
-                name_padding = max(0, DETAIL_LINE_WIDTH - (len(artifact_name) + 2))
-                content.append(f"║  <b>{artifact_name}</b>" + " " * name_padding + "║")
-                content.append("╚" + "═" * DETAIL_LINE_WIDTH + "╝")
-                content.append("")
-                content.append("┌─ <b>General Information</b>")
-                if artifact_data.get('aliases'):
-                    content.append(f"│  Aliases: {', '.join(artifact_data['aliases'])}")
-                if artifact_data.get('supported_os'):
-                    content.append(f"│  Supported OS: {', '.join(artifact_data['supported_os'])}")
-                content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                content.append("")
-                if artifact_data.get("doc"):
-                    content.append("┌─ <b>Description</b>")
-                    doc = artifact_data["doc"].strip()
-                    for line in doc.splitlines():
-                        content.append(f"│  {line}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                if artifact_data.get('sources'):
-                    content.append("┌─ <b>Sources</b>")
-                    for i, source in enumerate(artifact_data['sources'], 1):
-                        content.append(f"│")
-                        content.append(f"│  [{i}] Source Details:")
-                        content.append(f"│  ┌─ Type: {source.get('type', 'N/A')}")
-                        
-                        attrs = source.get('attributes', {})
-                        has_supported_os = bool(source.get('supported_os'))
-                        has_paths = bool(attrs.get('paths'))
-                        has_cmd = bool(attrs.get('cmd'))
-                        has_keys = bool(attrs.get('keys'))
-                        has_key_value_pairs = bool(attrs.get('key_value_pairs'))
-                        
-                        has_any_attrs = has_paths or has_cmd or has_keys or has_key_value_pairs
-                        
-                        if has_supported_os:
-                            connector = "├" if has_any_attrs else "└"
-                            content.append(f"│  {connector}─ OS: {', '.join(source['supported_os'])}")
-                        
-                        if has_paths:
-                            connector = "├" if (has_cmd or has_keys or has_key_value_pairs) else "└"
-                            content.append(f"│  {connector}─ Paths:")
-                            for path in attrs['paths']:
-                                content.append(f"│  │    • {path}")
-                        
-                        if has_cmd:
-                            connector = "├" if (has_keys or has_key_value_pairs) else "└"
-                            content.append(f"│  {connector}─ Command: {attrs['cmd']}")
-                            if attrs.get('args'):
-                                content.append(f"│  │    Arguments: {' '.join(attrs['args'])}")
-                        
-                        if has_keys:
-                            connector = "├" if has_key_value_pairs else "└"
-                            content.append(f"│  {connector}─ Registry Keys:")
-                            for key in attrs['keys']:
-                                content.append(f"│  │    • {key}")
-                        
-                        if has_key_value_pairs:
-                            content.append(f"│  └─ Registry Values:")
-                            for kv in attrs['key_value_pairs']:
-                                content.append(f"│       • {kv.get('key')}: {kv.get('value')}")
-                        elif not has_any_attrs and not has_supported_os:
-                            content.append(f"│  └")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                
-                if artifact_data.get('urls'):
-                    content.append("┌─ <b>References</b>")
-                    for url in artifact_data['urls']:
-                        content.append(f"│  • {url}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                
-                content.append("┌─ <b>Metadata</b>")
-                content.append(f"│  Category: {artifact_data.get('category', 'N/A')}")
-                content.append(f"│  File: {artifact_data.get('file', 'N/A')}")
-                content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                html_content = "\n".join(content).replace("\n", "<br>")
-                detail_view.setHtml(f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>{html_content}</pre>")
+            artifact_data = proxy_model.artifact_at(index)
+            if artifact_data is not None:
+                rendered = artifact_data.get("_html")
+                if rendered is None:
+                    rendered = _render_artifact_html(artifact_data)
+                    artifact_data["_html"] = rendered
+                detail_view.setHtml(rendered)
             else:
                 detail_view.clear()
         except Exception as e:
@@ -500,9 +465,8 @@ def display_artifacts_kb(parent, db_path):
     
     def on_item_double_clicked(index):
         try:
-            row = index.row()
-            if 0 <= row < len(full_data_store):
-                artifact_data = full_data_store[row]
+            artifact_data = proxy_model.artifact_at(index)
+            if artifact_data is not None:
                 show_detailed_view(kb_window, artifact_data)
         except Exception as e:
             logger.error("Error in double-click handler: %s", e)
@@ -510,18 +474,14 @@ def display_artifacts_kb(parent, db_path):
     
     tree_view.selectionModel().currentChanged.connect(on_item_selected)
     tree_view.doubleClicked.connect(on_item_double_clicked)
-    search_textbox.textChanged.connect(update_display)
+    search_debounce = QTimer(kb_window)
+    search_debounce.setSingleShot(True)
+    search_debounce.setInterval(SEARCH_DEBOUNCE_MS)
+    search_debounce.timeout.connect(update_display)
+    search_textbox.textChanged.connect(lambda _text: search_debounce.start())
     os_filter.currentTextChanged.connect(update_display)
     category_filter.currentTextChanged.connect(update_display)
-    try:
-        artifacts_data = load_artifacts_data()
-        if artifacts_data:
-            categories = sorted(set(a.get('category', 'Unknown') for a in artifacts_data))
-            category_filter.addItems(categories)
-    except Exception as e:
-        logger.error("Error populating category filter: %s", e)
-    populate_tree()
-    
+    category_filter.addItems(list(ARTIFACTS_CATEGORIES_CACHE or ()))
     kb_window.show()
     return kb_window
 
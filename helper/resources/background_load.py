@@ -0,0 +1,66 @@
+"""
+Background loading for the knowledge-base windows: the data is parsed on a worker thread
+while the window paints, and a window reopened mid-load shares the load already running.
+"""
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer, Signal
+
+
+class BackgroundLoader(QObject):
+    """Runs load_func on the worker thread; loaded is emitted there once it returns or raises."""
+    loaded = Signal()
+
+    def __init__(self, load_func, parent=None):
+        super().__init__(parent)
+        self.load_func = load_func
+        self.done = False
+
+    def run(self):
+        try:
+            self.load_func()
+        finally:
+            self.done = True
+            self.loaded.emit()
+
+
+class BackgroundLoad:
+    """One in-flight load of load_func, so only one thread parses the data and writes its cache."""
+
+    def __init__(self, load_func):
+        self.load_func = load_func
+        self.thread = None
+        self.loader = None
+
+    def start(self):
+        """Returns the loader in flight, or starts a new one."""
+        if self.thread is not None and self.thread.isRunning():
+            return self.loader
+        if self.thread is None:
+            QCoreApplication.instance().aboutToQuit.connect(self.stop)
+        self.thread = QThread()
+        self.loader = BackgroundLoader(self.load_func)
+        self.loader.moveToThread(self.thread)
+        self.loader.loaded.connect(self.thread.quit)
+        self.thread.started.connect(self.loader.run)
+        self.thread.start()
+        return self.loader
+
+    def stop(self):
+        """Joins the worker on quit so Qt is not torn down under a running QThread."""
+        if self.thread is not None:
+            self.thread.quit()
+            self.thread.wait()
+
+    def when_loaded(self, owner, callback):
+        """Starts or joins the load and calls callback on owner's (GUI) thread once it finishes."""
+        # loaded is emitted on the worker thread; a timer owned by the window relays it so the
+        # callback only touches widgets from the GUI thread.
+        relay = QTimer(owner)
+        relay.setSingleShot(True)
+        relay.setInterval(0)
+        relay.timeout.connect(callback)
+        loader = self.start()
+        loader.loaded.connect(relay.start)
+        if loader.done:
+            relay.start()
+        return relay
@@ -5,11 +5,12 @@ HijackLibs knowledge-base window for Kanvas: loads YAML data from data/hijacklib
 """
 
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import yaml
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSortFilterProxyModel, Qt, QTimer
 from PySide6.QtGui import QColor, QFont, QStandardItem, QStandardItemModel, QSyntaxHighlighter, QTextCharFormat
 from PySide6.QtWidgets import (
     QComboBox,
@@ -27,95 +28,265 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 from helper import styles
+from helper.resources.background_load import BackgroundLoad
+from helper.resources.pickle_cache import cache_signature, read_cache, write_cache
+from helper.resources.yaml_loader import load_yaml_documents
 
 logger = logging.getLogger(__name__)
 
 HIJACKLIBS_WINDOW = None
+_HIJACKLIB_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "hijacklib"
+# Data is kept sorted by Name and vendors sorted, so the window never re-sorts on open or filter.
 HIJACKLIBS_DATA_CACHE = None
+HIJACKLIBS_VENDORS_CACHE = None
 DETAIL_LINE_WIDTH = 78
 DETAIL_BORDER_WIDTH = 77
+HIJACKLIBS_LOAD_WORKERS = 8
+# Parsed hijacklibs are pickled inside data/hijacklib; bump the version when the stored layout changes.
+HIJACKLIBS_PICKLE_NAME = ".cache.pkl"
+HIJACKLIBS_PICKLE_VERSION = 2
+# Quiet period after the last keystroke before the search box re-filters the list.
+SEARCH_DEBOUNCE_MS = 150
+# Longer lines are left unhighlighted; regex passes over huge single-line blocks stall repaints.
+YAML_HIGHLIGHT_MAX_BLOCK = 16384
+
+
+def _walk_yaml(root):
+    """Paths of the .yml/.yaml files under root, using the scandir entry type instead of a stat per path.
+
+    Hidden directories (.git, .github, editor state) are not descended into.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith((".yml", ".yaml")) and entry.is_file():
+                    yield entry.path
+
+
+def _load_hijacklib_file(yml_path, hijacklib_dir):
+    """Hijacklib entries from one YAML file with file/file_path set; [] if the file cannot be loaded."""
+    hijacklibs = []
+    try:
+        for hijacklib in load_yaml_documents(yml_path, binary=True):
+            if isinstance(hijacklib, dict) and ("Name" in hijacklib or "name" in hijacklib):
+                name = hijacklib.pop("name", None)
+                if hijacklib.get("Name") is None:
+                    hijacklib["Name"] = name if name is not None else "Unknown"
+                hijacklib["file_path"] = os.path.relpath(yml_path, hijacklib_dir).replace(os.sep, "/")
+                hijacklib["file"] = os.path.basename(yml_path)
+                hijacklib["_name_lc"] = str(hijacklib["Name"]).lower()
+                hijacklibs.append(hijacklib)
+    except Exception as e:
+        logger.error("Error loading %s: %s", yml_path, e)
+    return hijacklibs
 
 
 def load_hijacklibs_data():
-    global HIJACKLIBS_DATA_CACHE
+    global HIJACKLIBS_DATA_CACHE, HIJACKLIBS_VENDORS_CACHE
     if HIJACKLIBS_DATA_CACHE is not None:
         return HIJACKLIBS_DATA_CACHE
     hijacklibs_data = []
-    base_dir = Path(__file__).parent.parent.parent
-    hijacklib_dir = base_dir / "data" / "hijacklib"
+    hijacklib_dir = _HIJACKLIB_DIR
     try:
         if not hijacklib_dir.exists():
             logger.error("HijackLibs directory not found: %s", hijacklib_dir)
             return []
-        yml_files = [f for f in hijacklib_dir.rglob("*") if f.is_file() and f.suffix.lower() in (".yml", ".yaml")]
+        yml_files = list(_walk_yaml(hijacklib_dir))
         logger.info("Found %s YAML files in hijacklib directory", len(yml_files))
         if not yml_files:
             logger.warning("No YAML files found in hijacklib directory.")
             return []
-        for yml_path in yml_files:
-            try:
-                with open(yml_path, "r", encoding="utf-8") as fp:
-                    content = fp.read()
-                documents = content.split("---")
-                for doc in documents:
-                    doc = doc.strip()
-                    if not doc or doc.startswith("#"):
-                        continue
-                    try:
-                        hijacklib = yaml.safe_load(doc)
-                        if hijacklib and ("Name" in hijacklib or "name" in hijacklib):
-                            if "name" in hijacklib and "Name" not in hijacklib:
-                                hijacklib["Name"] = hijacklib.pop("name")
-                            try:
-                                rel = yml_path.relative_to(hijacklib_dir)
-                                hijacklib["file_path"] = rel.as_posix()
-                            except ValueError:
-                                hijacklib["file_path"] = yml_path.name
-                            hijacklib["file"] = yml_path.name
-                            hijacklibs_data.append(hijacklib)
-                    except yaml.YAMLError as e:
-                        logger.error("YAML parse error in %s: %s", yml_path, e)
-                        continue
-            except Exception as e:
-                logger.error("Error loading %s: %s", yml_path, e)
-                continue
+        signature = cache_signature(HIJACKLIBS_PICKLE_VERSION, yml_files, hijacklib_dir)
+        cached = read_cache(hijacklib_dir / HIJACKLIBS_PICKLE_NAME, signature)
+        if cached is not None:
+            logger.info("Loaded %s hijacklibs from cache", len(cached))
+            HIJACKLIBS_VENDORS_CACHE = sorted({h['Vendor'] for h in cached if h.get('Vendor')})
+            HIJACKLIBS_DATA_CACHE = cached
+            return cached
+        # Files are read and parsed on worker threads; results come back in yml_files order.
+        with ThreadPoolExecutor(max_workers=min(HIJACKLIBS_LOAD_WORKERS, len(yml_files))) as pool:
+            for hijacklibs in pool.map(lambda yml_path: _load_hijacklib_file(yml_path, hijacklib_dir), yml_files):
+                hijacklibs_data.extend(hijacklibs)
+        hijacklibs_data.sort(key=lambda h: str(h["Name"]))
         logger.info("Loaded %s hijacklibs from %s files", len(hijacklibs_data), len(yml_files))
+        write_cache(hijacklib_dir / HIJACKLIBS_PICKLE_NAME, signature, hijacklibs_data)
     except Exception as e:
         logger.error("Error loading hijacklibs data: %s", e)
     
+    HIJACKLIBS_VENDORS_CACHE = sorted({h['Vendor'] for h in hijacklibs_data if h.get('Vendor')})
     HIJACKLIBS_DATA_CACHE = hijacklibs_data
     return hijacklibs_data
 
 class YAMLHighlighter(QSyntaxHighlighter):
 
+    _shared_rules = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
-        key_format = QTextCharFormat()
-        key_format.setForeground(QColor("#268bd2"))
-        key_format.setFontWeight(QFont.Bold)
-        self.highlighting_rules.append((r'^(\w+):', key_format))
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor("#2aa198"))
-        self.highlighting_rules.append((r'["\']([^"\']*)["\']', string_format))
-        list_format = QTextCharFormat()
-        list_format.setForeground(QColor("#859900"))
-        self.highlighting_rules.append((r'^\s*-\s+', list_format))
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor("#93a1a1"))
-        comment_format.setFontItalic(True)
-        self.highlighting_rules.append((r'#.*$', comment_format))
+        self.highlighting_rules = self._rules()
+
+    @classmethod
+    def _rules(cls):
+        """Compiled patterns and formats, built on first use and shared by every detail dialog."""
+        if cls._shared_rules is None:
+            key_format = QTextCharFormat()
+            key_format.setForeground(QColor("#268bd2"))
+            key_format.setFontWeight(QFont.Bold)
+            string_format = QTextCharFormat()
+            string_format.setForeground(QColor("#2aa198"))
+            list_format = QTextCharFormat()
+            list_format.setForeground(QColor("#859900"))
+            comment_format = QTextCharFormat()
+            comment_format.setForeground(QColor("#93a1a1"))
+            comment_format.setFontItalic(True)
+            cls._shared_rules = (
+                (re.compile(r'^(\w+):'), key_format),
+                (re.compile(r'["\']([^"\']*)["\']'), string_format),
+                (re.compile(r'^\s*-\s+'), list_format),
+                (re.compile(r'#.*$'), comment_format),
+            )
+        return cls._shared_rules
     
     def highlightBlock(self, text):
+        if len(text) > YAML_HIGHLIGHT_MAX_BLOCK:
+            return
+        # Patterns are compiled once per process; Qt passes one line per block, so no MULTILINE is needed.
         for pattern, fmt in self.highlighting_rules:
-            expression = re.compile(pattern, re.MULTILINE)
-            for match in expression.finditer(text):
+            for match in pattern.finditer(text):
                 start, end = match.span()
                 self.setFormat(start, end - start, fmt)
 
+def _detail_pre(body):
+    """Wrap detail text in the monospace <pre> block used by both detail panes."""
+    return f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>{body}</pre>"
+
+
+def _dict_lines(items, prefix):
+    """One "key: value" line per field of each dict in items; non-dict entries are skipped."""
+    return (f"{prefix}{key}: {value}" for item in items if isinstance(item, dict) for key, value in item.items())
+
+
+def _vulnerable_executable_lines(index, vuln_exe):
+    """Box-drawing lines for one entry of a hijacklib's VulnerableExecutables list."""
+    if not isinstance(vuln_exe, dict):
+        yield f"│  • {vuln_exe}"
+        return
+    yield "│"
+    yield f"│  [{index}] Executable Details:"
+    yield f"│  ┌─ Path: {vuln_exe.get('Path', 'N/A')}"
+    yield f"│  ├─ Type: {vuln_exe.get('Type', 'N/A')}"
+    if vuln_exe.get('SHA256'):
+        sha256_list = vuln_exe['SHA256'] if isinstance(vuln_exe['SHA256'], list) else [vuln_exe['SHA256']]
+        if len(sha256_list) == 1:
+            yield f"│  ├─ SHA256: {sha256_list[0]}"
+        else:
+            yield "│  ├─ SHA256:"
+            yield from (f"│  │    • {sha}" for sha in sha256_list)
+    if vuln_exe.get('ExpectedSignatureInformation'):
+        yield "│  ├─ Expected Signature Information:"
+        for sig_info in vuln_exe['ExpectedSignatureInformation']:
+            if isinstance(sig_info, dict):
+                yield from (f"│  │    {key}: {value}" for key, value in sig_info.items())
+            else:
+                yield f"│  │    • {sig_info}"
+    if vuln_exe.get('ExpectedVersionInformation'):
+        yield "│  └─ Expected Version Information:"
+        yield from _dict_lines(vuln_exe['ExpectedVersionInformation'], "│       ")
+    else:
+        yield "│  └"
+
+
+def _acknowledgement_line(ack):
+    if not isinstance(ack, dict):
+        return f"│  • {ack}"
+    twitter = ack.get('Twitter', '')
+    return f"│  • {ack.get('Name', 'N/A')} ({twitter})" if twitter else f"│  • {ack.get('Name', 'N/A')}"
+
+
+def _render_hijacklib_html(hijacklib_data):
+    """Detail view HTML for one hijacklib, rendered once and kept on the dict for later selections."""
+    rendered = hijacklib_data.get("_rendered_html")
+    if rendered is not None:
+        return rendered
+    hijacklib_name = str(hijacklib_data["Name"])
+    section_end = "└" + "─" * DETAIL_BORDER_WIDTH
+    name_padding = max(0, DETAIL_LINE_WIDTH - (len(hijacklib_name) + 2))
+    parts = [
+        "╔" + "═" * DETAIL_LINE_WIDTH + "╗",
+        f"║  <b>{hijacklib_name}</b>" + " " * name_padding + "║",
+        "╚" + "═" * DETAIL_LINE_WIDTH + "╝",
+        "",
+    ]
+    vuln_executables = hijacklib_data.get("VulnerableExecutables", [])
+    if vuln_executables:
+        exe_count = len(vuln_executables)
+        parts += [
+            "┌─ <b>DLL Hijacking Type</b>",
+            f"│  DLL Sideloading ({exe_count} EXE{'s' if exe_count > 1 else ''})",
+            "│",
+            "│  Copy (and optionally rename) a vulnerable application alongside a",
+            "│  malicious DLL to execute arbitrary code through the legitimate",
+            "│  application.",
+            "│",
+            "│  MITRE ATT&CK®: T1574.001 - Hijack Execution Flow: DLL",
+            section_end,
+            "",
+        ]
+    parts.append("┌─ <b>General Information</b>")
+    parts.extend(
+        f"│  {label}: {hijacklib_data[key]}"
+        for key, label in (('Vendor', "DLL Vendor"), ('Author', "Author"), ('Created', "Created"))
+        if hijacklib_data.get(key)
+    )
+    parts += [section_end, ""]
+    if hijacklib_data.get('ExpectedLocations'):
+        parts.append("┌─ <b>Expected Locations</b>")
+        parts.extend(f"│  • {location}" for location in hijacklib_data['ExpectedLocations'])
+        parts += [section_end, ""]
+    signatures = hijacklib_data.get('ExpectedSignatureInformation')
+    if signatures:
+        parts.append("┌─ <b>Expected Signature Information</b>")
+        for i, sig_info in enumerate(signatures, 1):
+            if isinstance(sig_info, dict):
+                parts.extend(f"│  {key}: {value}" for key, value in sig_info.items())
+                if i < len(signatures):
+                    parts.append("│")
+        parts += [section_end, ""]
+    if hijacklib_data.get('ExpectedVersionInformation'):
+        parts.append("┌─ <b>Expected Version Information</b>")
+        parts.extend(_dict_lines(hijacklib_data['ExpectedVersionInformation'], "│  "))
+        parts += [section_end, ""]
+    if vuln_executables:
+        parts.append("┌─ <b>Vulnerable Executables</b>")
+        for i, vuln_exe in enumerate(vuln_executables, 1):
+            parts.extend(_vulnerable_executable_lines(i, vuln_exe))
+        parts += [section_end, ""]
+    if hijacklib_data.get('Resources'):
+        parts.append("┌─ <b>Resources</b>")
+        parts.extend(f"│  • {resource}" for resource in hijacklib_data['Resources'])
+        parts += [section_end, ""]
+    if hijacklib_data.get('Acknowledgements'):
+        parts.append("┌─ <b>Acknowledgements</b>")
+        parts.extend(_acknowledgement_line(ack) for ack in hijacklib_data['Acknowledgements'])
+        parts += [section_end, ""]
+    parts += [
+        "┌─ <b>Metadata</b>",
+        f"│  File: {hijacklib_data.get('file', 'N/A')}",
+        f"│  Path: {hijacklib_data.get('file_path', 'N/A')}",
+        section_end,
+    ]
+    rendered = _detail_pre("<br>".join(parts))
+    hijacklib_data["_rendered_html"] = rendered
+    return rendered
+
+
 def show_detailed_view(parent, hijacklib_data):
     detail_dialog = QDialog(parent)
-    hijacklib_name = hijacklib_data.get('Name', hijacklib_data.get('name', 'Unknown'))
+    hijacklib_name = hijacklib_data["Name"]
     detail_dialog.setWindowTitle(f"HijackLib Details - {hijacklib_name}")
     detail_dialog.resize(900, 700)
     detail_dialog.setWindowFlags(Qt.Window | Qt.CustomizeWindowHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint | Qt.WindowMinimizeButtonHint)
@@ -134,125 +305,7 @@ def show_detailed_view(parent, hijacklib_data):
     text_area.setReadOnly(True)
     text_area.setFont(QFont("Consolas", 10) or QFont("Courier New", 10))
     text_area.setStyleSheet(styles.TEXT_EDIT_KB_DETAIL_DIALOG)
-    hijacklib_name = hijacklib_data.get("Name", hijacklib_data.get("name", "Unknown"))
-    content = []
-    content.append("╔" + "═" * DETAIL_LINE_WIDTH + "╗")
-    name_padding = max(0, DETAIL_LINE_WIDTH - (len(hijacklib_name) + 2))
-    content.append(f"║  <b>{hijacklib_name}</b>" + " " * name_padding + "║")
-    content.append("╚" + "═" * DETAIL_LINE_WIDTH + "╝")
-    content.append("")
-    vuln_executables = hijacklib_data.get('VulnerableExecutables', [])
-    if vuln_executables:
-        exe_count = len(vuln_executables)
-        hijack_type = f"DLL Sideloading ({exe_count} EXE{'s' if exe_count > 1 else ''})"
-        content.append(f"┌─ <b>DLL Hijacking Type</b>")
-        content.append(f"│  {hijack_type}")
-        content.append("│")
-        content.append("│  Copy (and optionally rename) a vulnerable application alongside a")
-        content.append("│  malicious DLL to execute arbitrary code through the legitimate")
-        content.append("│  application.")
-        content.append("│")
-        content.append("│  MITRE ATT&CK®: T1574.001 - Hijack Execution Flow: DLL")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    content.append("┌─ <b>General Information</b>")
-    if hijacklib_data.get('Vendor'):
-        content.append(f"│  DLL Vendor: {hijacklib_data['Vendor']}")
-    if hijacklib_data.get('Author'):
-        content.append(f"│  Author: {hijacklib_data['Author']}")
-    if hijacklib_data.get('Created'):
-        content.append(f"│  Created: {hijacklib_data['Created']}")
-    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-    content.append("")
-    if hijacklib_data.get('ExpectedLocations'):
-        content.append("┌─ <b>Expected Locations</b>")
-        for location in hijacklib_data['ExpectedLocations']:
-            content.append(f"│  • {location}")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    if hijacklib_data.get('ExpectedSignatureInformation'):
-        content.append("┌─ <b>Expected Signature Information</b>")
-        for i, sig_info in enumerate(hijacklib_data['ExpectedSignatureInformation'], 1):
-            if isinstance(sig_info, dict):
-                for key, value in sig_info.items():
-                    content.append(f"│  {key}: {value}")
-                if i < len(hijacklib_data['ExpectedSignatureInformation']):
-                    content.append("│")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    if hijacklib_data.get('ExpectedVersionInformation'):
-        content.append("┌─ <b>Expected Version Information</b>")
-        for ver_info in hijacklib_data['ExpectedVersionInformation']:
-            if isinstance(ver_info, dict):
-                for key, value in ver_info.items():
-                    content.append(f"│  {key}: {value}")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    if hijacklib_data.get('VulnerableExecutables'):
-        content.append("┌─ <b>Vulnerable Executables</b>")
-        for i, vuln_exe in enumerate(hijacklib_data['VulnerableExecutables'], 1):
-            if isinstance(vuln_exe, dict):
-                content.append(f"│")
-                content.append(f"│  [{i}] Executable Details:")
-                content.append(f"│  ┌─ Path: {vuln_exe.get('Path', 'N/A')}")
-                content.append(f"│  ├─ Type: {vuln_exe.get('Type', 'N/A')}")
-                
-                if vuln_exe.get('SHA256'):
-                    sha256_list = vuln_exe['SHA256'] if isinstance(vuln_exe['SHA256'], list) else [vuln_exe['SHA256']]
-                    if len(sha256_list) == 1:
-                        content.append(f"│  ├─ SHA256: {sha256_list[0]}")
-                    else:
-                        content.append(f"│  ├─ SHA256:")
-                        for sha in sha256_list:
-                            content.append(f"│  │    • {sha}")
-                
-                if vuln_exe.get('ExpectedSignatureInformation'):
-                    content.append(f"│  ├─ Expected Signature Information:")
-                    for sig_info in vuln_exe['ExpectedSignatureInformation']:
-                        if isinstance(sig_info, dict):
-                            for key, value in sig_info.items():
-                                content.append(f"│  │    {key}: {value}")
-                        else:
-                            content.append(f"│  │    • {sig_info}")
-                
-                if vuln_exe.get('ExpectedVersionInformation'):
-                    content.append(f"│  └─ Expected Version Information:")
-                    for ver_info in vuln_exe['ExpectedVersionInformation']:
-                        if isinstance(ver_info, dict):
-                            for key, value in ver_info.items():
-                                content.append(f"│       {key}: {value}")
-                else:
-                    content.append(f"│  └")
-            else:
-                content.append(f"│  • {vuln_exe}")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    if hijacklib_data.get('Resources'):
-        content.append("┌─ <b>Resources</b>")
-        for resource in hijacklib_data['Resources']:
-            content.append(f"│  • {resource}")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    if hijacklib_data.get('Acknowledgements'):
-        content.append("┌─ <b>Acknowledgements</b>")
-        for ack in hijacklib_data['Acknowledgements']:
-            if isinstance(ack, dict):
-                name = ack.get('Name', 'N/A')
-                twitter = ack.get('Twitter', '')
-                if twitter:
-                    content.append(f"│  • {name} ({twitter})")
-                else:
-                    content.append(f"│  • {name}")
-            else:
-                content.append(f"│  • {ack}")
-        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-        content.append("")
-    content.append("┌─ <b>Metadata</b>")
-    content.append(f"│  File: {hijacklib_data.get('file', 'N/A')}")
-    content.append(f"│  Path: {hijacklib_data.get('file_path', 'N/A')}")
-    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-    html_content = "\n".join(content).replace("\n", "<br>")
-    text_area.setHtml(f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>{html_content}</pre>")
+    text_area.setHtml(_render_hijacklib_html(hijacklib_data))
     layout.addWidget(text_area)
     
     close_button = QPushButton("Close")
@@ -268,6 +321,53 @@ def show_detailed_view(parent, hijacklib_data):
     
     detail_dialog.exec()
 
+class HijackLibFilterProxyModel(QSortFilterProxyModel):
+    """Filters the static hijacklib list by name search and vendor without rebuilding the source model.
+
+    Dicts stay in a list indexed by source row rather than in Qt.UserRole item data, where PySide
+    would convert each one to a QVariantMap copy on every read.
+    """
+
+    def __init__(self, hijacklibs=(), parent=None):
+        super().__init__(parent)
+        self._hijacklibs = hijacklibs
+        self._search_lower = ""
+        self._vendor_filter = "All"
+
+    def set_hijacklibs(self, hijacklibs):
+        """Rows of the source model map to this list by index; set it before the rows are inserted."""
+        self._hijacklibs = hijacklibs
+
+    def hijacklib_at(self, index):
+        """Hijacklib dict behind a proxy index, or None."""
+        if not index.isValid():
+            return None
+        row = self.mapToSource(index).row()
+        if 0 <= row < len(self._hijacklibs):
+            return self._hijacklibs[row]
+        return None
+
+    def set_filters(self, search_text="", vendor_filter_text="All"):
+        """Apply the filters; returns False without re-filtering when they are unchanged."""
+        search_lower = search_text.strip().lower() if search_text else ""
+        if (search_lower, vendor_filter_text) == (self._search_lower, self._vendor_filter):
+            return False
+        self._search_lower = search_lower
+        self._vendor_filter = vendor_filter_text
+        self.invalidateRowsFilter()
+        return True
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        hijacklib = self._hijacklibs[source_row]
+        if self._vendor_filter != "All" and hijacklib.get('Vendor', '') != self._vendor_filter:
+            return False
+        if self._search_lower and self._search_lower not in hijacklib["_name_lc"]:
+            return False
+        return True
+
+
+HIJACKLIBS_LOAD = BackgroundLoad(load_hijacklibs_data)
+
 NO_DATA_MSG = "No data found. Please click 'Download Updates' to download the latest files."
 
 
@@ -277,8 +377,7 @@ def display_hijacklibs_kb(parent, db_path):
         HIJACKLIBS_WINDOW.activateWindow()
         HIJACKLIBS_WINDOW.raise_()
         return HIJACKLIBS_WINDOW
-    data = load_hijacklibs_data()
-    if not data:
+    if HIJACKLIBS_DATA_CACHE is not None and not HIJACKLIBS_DATA_CACHE:
         QMessageBox.information(parent.window, "No Data", NO_DATA_MSG)
         return None
     kb_window = QWidget(parent.window)
@@ -344,7 +443,10 @@ def display_hijacklibs_kb(parent, db_path):
     
     model = QStandardItemModel()
     model.setHorizontalHeaderLabels(["Name"])
-    tree_view.setModel(model)
+    proxy_model = HijackLibFilterProxyModel(parent=kb_window)
+    proxy_model.setSourceModel(model)
+    tree_view.setModel(proxy_model)
+    tree_view.sortByColumn(0, Qt.AscendingOrder)
     tree_view.setColumnWidth(0, 210)
     
     splitter.addWidget(tree_view)
@@ -352,7 +454,7 @@ def display_hijacklibs_kb(parent, db_path):
     detail_view.setReadOnly(True)
     detail_view.setFont(QFont("Consolas", 10) or QFont("Courier New", 10))
     detail_view.setStyleSheet(styles.DETAIL_VIEW_KB_STYLE)
-    detail_view.setPlaceholderText("Select a hijacklib to view details...")
+    detail_view.setPlaceholderText("Loading hijacklibs...")
     splitter.addWidget(detail_view)
     
     splitter.setStretchFactor(0, 1)
@@ -370,196 +472,30 @@ def display_hijacklibs_kb(parent, db_path):
     footer_layout.addStretch()
     main_layout.addLayout(footer_layout)
     
-    full_data_store = []
-    
-    def filter_hijacklibs(search_text="", vendor_filter_text="All"):
-        filtered = []
-        try:
-            hijacklibs_data = load_hijacklibs_data()
-            if not hijacklibs_data:
-                return []
-            
-            search_lower = search_text.strip().lower() if search_text else None
-            for hijacklib in hijacklibs_data:
-                if search_lower is not None:
-                    name = hijacklib.get("Name", hijacklib.get("name", ""))
-                    if search_lower not in str(name).lower():
-                        continue
-                if vendor_filter_text != "All":
-                    vendor = hijacklib.get('Vendor', '')
-                    if vendor != vendor_filter_text:
-                        continue
-                
-                filtered.append(hijacklib)
-        except Exception as e:
-            logger.error("Error filtering hijacklibs: %s", e)
-        return filtered
-    
-    def populate_tree(search_text="", vendor_filter_text="All"):
-        nonlocal full_data_store
-        model.removeRows(0, model.rowCount())
-        full_data_store.clear()
-        
-        try:
-            filtered_data = filter_hijacklibs(search_text, vendor_filter_text)
-            
-            if not filtered_data:
-                if not load_hijacklibs_data():
-                    QMessageBox.information(kb_window, "No HijackLibs Data", 
-                        "No hijacklibs data found. Please ensure the data/hijacklib directory exists and contains YAML files.")
-                    return
-            for hijacklib in sorted(filtered_data, key=lambda x: x.get('Name', x.get('name', ''))):
-                name = str(hijacklib.get('Name', hijacklib.get('name', '')))
-                
-                item = QStandardItem(name)
-                model.appendRow(item)
-                full_data_store.append(hijacklib)
-            
-            logger.info("Displayed %s hijacklibs, stored %s items for detailed view", len(filtered_data), len(full_data_store))
-        except Exception as e:
-            logger.error("Error populating tree: %s", e)
-            QMessageBox.critical(kb_window, "Error", f"Failed to populate data: {e}")
-    
     def update_display():
         search_text = search_textbox.text()
         vendor_filter_text = vendor_filter.currentText()
-        populate_tree(search_text, vendor_filter_text)
+        try:
+            if proxy_model.set_filters(search_text, vendor_filter_text):
+                logger.info("Displayed %s hijacklibs", proxy_model.rowCount())
+        except Exception as e:
+            logger.error("Error filtering hijacklibs: %s", e)
     
     def on_item_selected(index):
         try:
-            row = index.row()
-            if 0 <= row < len(full_data_store):
-                hijacklib_data = full_data_store[row]
-                hijacklib_name = hijacklib_data.get("Name", hijacklib_data.get("name", "N/A"))
-                content = []
-                content.append("╔" + "═" * DETAIL_LINE_WIDTH + "╗")
-                name_padding = max(0, DETAIL_LINE_WIDTH - (len(hijacklib_name) + 2))
-                content.append(f"║  <b>{hijacklib_name}</b>" + " " * name_padding + "║")
-                content.append("╚" + "═" * DETAIL_LINE_WIDTH + "╝")
-                content.append("")
-                vuln_executables = hijacklib_data.get("VulnerableExecutables", [])
-                if vuln_executables:
-                    exe_count = len(vuln_executables)
-                    hijack_type = f"DLL Sideloading ({exe_count} EXE{'s' if exe_count > 1 else ''})"
-                    content.append(f"┌─ <b>DLL Hijacking Type</b>")
-                    content.append(f"│  {hijack_type}")
-                    content.append("│")
-                    content.append("│  Copy (and optionally rename) a vulnerable application alongside a")
-                    content.append("│  malicious DLL to execute arbitrary code through the legitimate")
-                    content.append("│  application.")
-                    content.append("│")
-                    content.append("│  MITRE ATT&CK®: T1574.001 - Hijack Execution Flow: DLL")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                content.append("┌─ <b>General Information</b>")
-                if hijacklib_data.get('Vendor'):
-                    content.append(f"│  DLL Vendor: {hijacklib_data['Vendor']}")
-                if hijacklib_data.get('Author'):
-                    content.append(f"│  Author: {hijacklib_data['Author']}")
-                if hijacklib_data.get('Created'):
-                    content.append(f"│  Created: {hijacklib_data['Created']}")
-                content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                content.append("")
-                if hijacklib_data.get('ExpectedLocations'):
-                    content.append("┌─ <b>Expected Locations</b>")
-                    for location in hijacklib_data['ExpectedLocations']:
-                        content.append(f"│  • {location}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                if hijacklib_data.get('ExpectedSignatureInformation'):
-                    content.append("┌─ <b>Expected Signature Information</b>")
-                    for i, sig_info in enumerate(hijacklib_data['ExpectedSignatureInformation'], 1):
-                        if isinstance(sig_info, dict):
-                            for key, value in sig_info.items():
-                                content.append(f"│  {key}: {value}")
-                            if i < len(hijacklib_data['ExpectedSignatureInformation']):
-                                content.append("│")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                if hijacklib_data.get('ExpectedVersionInformation'):
-                    content.append("┌─ <b>Expected Version Information</b>")
-                    for ver_info in hijacklib_data['ExpectedVersionInformation']:
-                        if isinstance(ver_info, dict):
-                            for key, value in ver_info.items():
-                                content.append(f"│  {key}: {value}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                if hijacklib_data.get('VulnerableExecutables'):
-                    content.append("┌─ <b>Vulnerable Executables</b>")
-                    for i, vuln_exe in enumerate(hijacklib_data['VulnerableExecutables'], 1):
-                        if isinstance(vuln_exe, dict):
-                            content.append(f"│")
-                            content.append(f"│  [{i}] Executable Details:")
-                            content.append(f"│  ┌─ Path: {vuln_exe.get('Path', 'N/A')}")
-                            content.append(f"│  ├─ Type: {vuln_exe.get('Type', 'N/A')}")
-                            
-                            if vuln_exe.get('SHA256'):
-                                sha256_list = vuln_exe['SHA256'] if isinstance(vuln_exe['SHA256'], list) else [vuln_exe['SHA256']]
-                                if len(sha256_list) == 1:
-                                    content.append(f"│  ├─ SHA256: {sha256_list[0]}")
-                                else:
-                                    content.append(f"│  ├─ SHA256:")
-                                    for sha in sha256_list:
-                                        content.append(f"│  │    • {sha}")
-                            
-                            if vuln_exe.get('ExpectedSignatureInformation'):
-                                content.append(f"│  ├─ Expected Signature Information:")
-                                for sig_info in vuln_exe['ExpectedSignatureInformation']:
-                                    if isinstance(sig_info, dict):
-                                        for key, value in sig_info.items():
-                                            content.append(f"│  │    {key}: {value}")
-                                    else:
-                                        content.append(f"│  │    • {sig_info}")
-                            
-                            if vuln_exe.get('ExpectedVersionInformation'):
-                                content.append(f"│  └─ Expected Version Information:")
-                                for ver_info in vuln_exe['ExpectedVersionInformation']:
-                                    if isinstance(ver_info, dict):
-                                        for key, value in ver_info.items():
-                                            content.append(f"│       {key}: {value}")
-                            else:
-                                content.append(f"│  └")
-                        else:
-                            content.append(f"│  • {vuln_exe}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                if hijacklib_data.get('Resources'):
-                    content.append("┌─ <b>Resources</b>")
-                    for resource in hijacklib_data['Resources']:
-                        content.append(f"│  • {resource}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                if hijacklib_data.get('Acknowledgements'):
-                    content.append("┌─ <b>Acknowledgements</b>")
-                    for ack in hijacklib_data['Acknowledgements']:
-                        if isinstance(ack, dict):
-                            name = ack.get('Name', 'N/A')
-                            twitter = ack.get('Twitter', '')
-                            if twitter:
-                                content.append(f"│  • {name} ({twitter})")
-                            else:
-                                content.append(f"│  • {name}")
-                        else:
-                            content.append(f"│  • {ack}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                content.append("┌─ <b>Metadata</b>")
-                content.append(f"│  File: {hijacklib_data.get('file', 'N/A')}")
-                content.append(f"│  Path: {hijacklib_data.get('file_path', 'N/A')}")
-                content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                html_content = "\n".join(content).replace("\n", "<br>")
-                detail_view.setHtml(f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>{html_content}</pre>")
+            hijacklib_data = proxy_model.hijacklib_at(index)
+            if hijacklib_data is not None:
+                detail_view.setHtml(_render_hijacklib_html(hijacklib_data))
             else:
                 detail_view.clear()
         except Exception as e:
             logger.error("Error in selection handler: %s", e)
-            detail_view.setHtml(f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>Error loading hijacklib details: {e}</pre>")
+            detail_view.setHtml(_detail_pre(f"Error loading hijacklib details: {e}"))
     
     def on_item_double_clicked(index):
         try:
-            row = index.row()
-            if 0 <= row < len(full_data_store):
-                hijacklib_data = full_data_store[row]
+            hijacklib_data = proxy_model.hijacklib_at(index)
+            if hijacklib_data is not None:
                 show_detailed_view(kb_window, hijacklib_data)
         except Exception as e:
             logger.error("Error in double-click handler: %s", e)
@@ -567,17 +503,33 @@ def display_hijacklibs_kb(parent, db_path):
     
     tree_view.selectionModel().currentChanged.connect(on_item_selected)
     tree_view.doubleClicked.connect(on_item_double_clicked)
-    search_textbox.textChanged.connect(update_display)
+    search_debounce = QTimer(kb_window)
+    search_debounce.setSingleShot(True)
+    search_debounce.setInterval(SEARCH_DEBOUNCE_MS)
+    search_debounce.timeout.connect(update_display)
+    search_textbox.textChanged.connect(lambda _text: search_debounce.start())
     vendor_filter.currentTextChanged.connect(update_display)
-    try:
-        hijacklibs_data = load_hijacklibs_data()
-        if hijacklibs_data:
-            vendors = sorted(set(h.get('Vendor', '') for h in hijacklibs_data if h.get('Vendor')))
-            vendor_filter.addItems(vendors)
-    except Exception as e:
-        logger.error("Error populating vendor filter: %s", e)
-    populate_tree()
     
+    def show_hijacklibs():
+        if HIJACKLIBS_WINDOW is not kb_window:
+            return
+        data = HIJACKLIBS_DATA_CACHE or []
+        if not data:
+            QMessageBox.information(kb_window, "No Data", NO_DATA_MSG)
+            kb_window.close()
+            return
+        proxy_model.set_hijacklibs(data)
+        items = [QStandardItem(str(hijacklib["Name"])) for hijacklib in data]
+        tree_view.setUpdatesEnabled(False)
+        model.invisibleRootItem().appendRows(items)
+        tree_view.setUpdatesEnabled(True)
+        vendor_filter.addItems(HIJACKLIBS_VENDORS_CACHE or [])
+        detail_view.setPlaceholderText("Select a hijacklib to view details...")
+    
+    if HIJACKLIBS_DATA_CACHE is not None:
+        show_hijacklibs()
+    else:
+        HIJACKLIBS_LOAD.when_loaded(kb_window, show_hijacklibs)
     kb_window.show()
     return kb_window
 
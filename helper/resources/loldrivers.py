@@ -4,11 +4,19 @@ driver data from data/microsoft/drivers.json, provides search and detail view.
 Cross-platform (Windows, macOS, Linux). Revised on 01/02/2026 by Jinto Antony
 """
 
+import html
 import json
 import logging
+import mmap
+import os
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from PySide6.QtCore import QSortFilterProxyModel, Qt, QTimer
 from PySide6.QtGui import QFont, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QDialog,
@@ -25,13 +33,134 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 from helper import styles
+from helper.resources.background_load import BackgroundLoad
+from helper.resources.pickle_cache import cache_signature, read_cache, write_cache
 
 logger = logging.getLogger(__name__)
 
 LOLDRIVERS_WINDOW = None
+# Drivers are kept sorted by name, so the window never re-sorts on open.
 LOLDRIVERS_DATA_CACHE = None
 DETAIL_LINE_WIDTH = 78
 DETAIL_BORDER_WIDTH = 77
+DETAIL_TOP_BORDER = "╔" + "═" * DETAIL_LINE_WIDTH + "╗"
+DETAIL_BOTTOM_BORDER = "╚" + "═" * DETAIL_LINE_WIDTH + "╝"
+DETAIL_SECTION_END = "└" + "─" * DETAIL_BORDER_WIDTH
+DIALOG_RULE = "=" * 80
+DIALOG_SECTION_RULE = "-" * 40
+# Projected drivers are pickled next to drivers.json; bump the version when the stored layout changes.
+LOLDRIVERS_PICKLE_NAME = "drivers.cache.pkl"
+LOLDRIVERS_PICKLE_VERSION = 1
+# Samples shown in the side pane; the double-click dialog lists every sample.
+DETAIL_SAMPLE_LIMIT = 20
+# orjson decodes drivers.json several times faster when installed; its JSONDecodeError subclasses json's.
+JSON_LOADS = orjson.loads if orjson is not None else json.loads
+# Quiet period after the last keystroke before the search box re-filters the list.
+SEARCH_DEBOUNCE_MS = 150
+# Quiet period after the current row changes before the detail pane is rendered.
+DETAIL_DEBOUNCE_MS = 120
+
+
+# (key, label) rows of the detail views, in display order. The None key in
+# SAMPLE_FIELDS stands for the combined file/product version row.
+BASIC_FIELDS = (
+    ('category', 'Category'),
+    ('verified', 'Verified'),
+    ('author', 'Author'),
+    ('created', 'Created'),
+    ('mitre_id', 'MITRE ID'),
+)
+COMMAND_FIELDS = (
+    ('Description', 'Description'),
+    ('Usecase', 'Usecase'),
+    ('Privileges', 'Privileges'),
+    ('OperatingSystem', 'Operating System'),
+)
+SAMPLE_FIELDS = (
+    ('SHA256', 'SHA256'),
+    ('MD5', 'MD5'),
+    ('SHA1', 'SHA1'),
+    ('Company', 'Company'),
+    ('Publisher', 'Publisher'),
+    ('Product', 'Product'),
+    (None, 'Version'),
+    ('MachineType', 'Machine Type'),
+    ('CreationTimestamp', 'Creation Timestamp'),
+    ('Signature', 'Signature'),
+    ('LoadsDespiteHVCI', 'Loads Despite HVCI'),
+    ('Imphash', 'Imphash'),
+)
+VERSION_FIELDS = (('FileVersion', 'File'), ('ProductVersion', 'Product'))
+
+
+def _field_rows(obj, fields):
+    """(label, value) pairs for the fields of obj that are set, in the order of fields."""
+    rows = []
+    for key, label in fields:
+        if key is None:
+            value = ", ".join(f"{part}: {obj[version_key]}" for version_key, part in VERSION_FIELDS if obj.get(version_key))
+        else:
+            value = obj.get(key)
+        if value:
+            rows.append((label, value))
+    return rows
+
+
+def _escape(value):
+    """Value as text for the detail HTML; driver data must not inject markup."""
+    return html.escape(str(value), quote=False)
+
+
+def _branch_lines(rows):
+    """Tree lines for rows: "├─" on all but the last, "└─" on the last, a bare "└" when empty."""
+    if not rows:
+        return ["│  └"]
+    last = len(rows) - 1
+    return [f"│  {'└' if i == last else '├'}─ {label}: {_escape(value)}" for i, (label, value) in enumerate(rows)]
+
+
+def _project_driver(driver_entry):
+    """The fields of one drivers.json entry that the window reads, keyed the way the UI expects."""
+    get = driver_entry.get
+    tags = get('Tags', [])
+    return {
+        'name': tags[0] if tags else 'Unknown',
+        'tags': tags,
+        'verified': get('Verified', ''),
+        'author': get('Author', ''),
+        'created': get('Created', ''),
+        'mitre_id': get('MitreID', ''),
+        'category': get('Category', ''),
+        'commands': get('Commands', {}),
+        'resources': get('Resources', []),
+        'detection': get('Detection', []),
+        'acknowledgement': get('Acknowledgement', {}),
+        'known_vulnerable_samples': get('KnownVulnerableSamples', []),
+        'id': get('Id', '')
+    }
+
+
+def _index_driver(driver):
+    """Precompute the lowercased search text: the driver name plus every sample and Authentihash digest."""
+    parts = [str(driver['name'])]
+    for sample in driver['known_vulnerable_samples']:
+        if not isinstance(sample, dict):
+            continue
+        parts.extend(str(sample[key]) for key in ('SHA256', 'SHA1', 'MD5') if sample.get(key))
+        auth_hash = sample.get('Authentihash', {})
+        if isinstance(auth_hash, dict):
+            parts.extend(str(auth_hash[key]) for key in ('SHA256', 'SHA1', 'MD5') if auth_hash.get(key))
+    driver['_search_blob'] = "\0".join(parts).lower()
+
+
+def _read_drivers_json(drivers_file_path):
+    """Decoded drivers.json; orjson reads it straight from a read-only memory map when available."""
+    with open(drivers_file_path, "rb") as fp:
+        if orjson is None or os.fstat(fp.fileno()).st_size == 0:
+            return JSON_LOADS(fp.read())
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
 
 
 def load_loldrivers_data():
@@ -54,37 +183,32 @@ def load_loldrivers_data():
             logger.error("Drivers file not found: %s", drivers_file)
             logger.warning("Drivers file does not exist. Please ensure the data/microsoft/drivers.json file exists.")
             return []
-        with open(drivers_file_path, "r", encoding="utf-8") as fp:
-            data = json.load(fp)
+        signature = cache_signature(LOLDRIVERS_PICKLE_VERSION, [drivers_file_path], drivers_file_path.parent)
+        cache_path = drivers_file_path.with_name(LOLDRIVERS_PICKLE_NAME)
+        cached = read_cache(cache_path, signature)
+        if cached is not None:
+            logger.info("Loaded %s drivers from cache", len(cached))
+            LOLDRIVERS_DATA_CACHE = cached
+            return cached
+        data = _read_drivers_json(drivers_file_path)
             
         if not isinstance(data, list):
             logger.error("Drivers JSON file does not contain an array")
             return []
         
-        for driver_entry in data:
-            if not isinstance(driver_entry, dict):
-                continue
-            tags = driver_entry.get('Tags', [])
-            driver_name = tags[0] if tags and len(tags) > 0 else 'Unknown'
-            commands_obj = driver_entry.get('Commands', {})
-            
-            loldrivers_data.append({
-                'name': driver_name,
-                'tags': tags,
-                'verified': driver_entry.get('Verified', ''),
-                'author': driver_entry.get('Author', ''),
-                'created': driver_entry.get('Created', ''),
-                'mitre_id': driver_entry.get('MitreID', ''),
-                'category': driver_entry.get('Category', ''),
-                'commands': commands_obj,
-                'resources': driver_entry.get('Resources', []),
-                'detection': driver_entry.get('Detection', []),
-                'acknowledgement': driver_entry.get('Acknowledgement', {}),
-                'known_vulnerable_samples': driver_entry.get('KnownVulnerableSamples', []),
-                'id': driver_entry.get('Id', '')
-            })
+        # Project each entry and drop it from the parsed array as we go, so the raw
+        # driver dicts (with every field the UI never reads) are released one by one.
+        data.reverse()
+        while data:
+            driver_entry = data.pop()
+            if isinstance(driver_entry, dict):
+                driver = _project_driver(driver_entry)
+                _index_driver(driver)
+                loldrivers_data.append(driver)
+        loldrivers_data.sort(key=lambda driver: str(driver['name']))
         
         logger.info("Loaded %s drivers from %s", len(loldrivers_data), drivers_file_path)
+        write_cache(cache_path, signature, loldrivers_data)
     except json.JSONDecodeError as e:
         logger.error("JSON parse error in %s: %s", drivers_file_path, e)
         return []
@@ -97,7 +221,8 @@ def load_loldrivers_data():
 
 def show_detailed_view(parent, item_data):
     detail_dialog = QDialog(parent)
-    driver_name = item_data.get('name', 'Unknown')
+    get = item_data.get
+    driver_name = get('name', 'Unknown')
     detail_dialog.setWindowTitle(f"LOLDrivers Details - {driver_name}")
     detail_dialog.resize(900, 700)
     detail_dialog.setWindowFlags(Qt.Window | Qt.CustomizeWindowHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint | Qt.WindowMinimizeButtonHint)
@@ -118,120 +243,117 @@ def show_detailed_view(parent, item_data):
     text_area.setStyleSheet(styles.TEXT_EDIT_KB_DETAIL_DIALOG)
     
     content = []
-    content.append("=" * 80)
-    content.append(f"LOLDRIVERS DETAILS: {driver_name}")
-    content.append("=" * 80)
+    content.append(DIALOG_RULE)
+    content.append(f"LOLDRIVERS DETAILS: {_escape(driver_name)}")
+    content.append(DIALOG_RULE)
     content.append("")
     content.append("BASIC INFORMATION:")
-    content.append("-" * 40)
-    content.append(f"Name: {driver_name}")
-    if item_data.get('category'):
-        content.append(f"Category: {item_data['category']}")
-    if item_data.get('verified'):
-        content.append(f"Verified: {item_data['verified']}")
-    if item_data.get('author'):
-        content.append(f"Author: {item_data['author']}")
-    if item_data.get('created'):
-        content.append(f"Created: {item_data['created']}")
-    if item_data.get('mitre_id'):
-        content.append(f"MITRE ID: {item_data['mitre_id']}")
-    if item_data.get('tags'):
-        content.append(f"Tags: {', '.join(item_data['tags'])}")
+    content.append(DIALOG_SECTION_RULE)
+    content.append(f"Name: {_escape(driver_name)}")
+    for key, label in BASIC_FIELDS:
+        value = get(key)
+        if value:
+            content.append(f"{label}: {_escape(value)}")
+    tags = get('tags')
+    if tags:
+        content.append(f"Tags: {_escape(', '.join(tags))}")
     content.append("")
-    commands_obj = item_data.get('commands', {})
+    commands_obj = get('commands', {})
     if commands_obj and isinstance(commands_obj, dict):
         content.append("COMMANDS:")
-        content.append("-" * 40)
+        content.append(DIALOG_SECTION_RULE)
         if commands_obj.get('Command'):
-            content.append(f"  <span style='color: red; font-weight: bold;'>Command:</span> {commands_obj.get('Command', 'N/A')}")
+            content.append(f"  <span style='color: red; font-weight: bold;'>Command:</span> {_escape(commands_obj.get('Command', 'N/A'))}")
         if commands_obj.get('Description'):
-            content.append(f"  Description: {commands_obj.get('Description', 'N/A')}")
+            content.append(f"  Description: {_escape(commands_obj.get('Description', 'N/A'))}")
         if commands_obj.get('Usecase'):
-            content.append(f"  Usecase: {commands_obj.get('Usecase', 'N/A')}")
+            content.append(f"  Usecase: {_escape(commands_obj.get('Usecase', 'N/A'))}")
         if commands_obj.get('Privileges'):
-            content.append(f"  Privileges: {commands_obj.get('Privileges', 'N/A')}")
+            content.append(f"  Privileges: {_escape(commands_obj.get('Privileges', 'N/A'))}")
         if commands_obj.get('OperatingSystem'):
-            content.append(f"  Operating System: {commands_obj.get('OperatingSystem', 'N/A')}")
+            content.append(f"  Operating System: {_escape(commands_obj.get('OperatingSystem', 'N/A'))}")
         content.append("")
-    samples = item_data.get('known_vulnerable_samples', [])
+    samples = get('known_vulnerable_samples', [])
     if samples:
         content.append("KNOWN VULNERABLE SAMPLES:")
-        content.append("-" * 40)
+        content.append(DIALOG_SECTION_RULE)
         for i, sample in enumerate(samples, 1):
             content.append(f"Sample {i}:")
             if isinstance(sample, dict):
                 if sample.get('Filename'):
-                    content.append(f"  Filename: {sample['Filename']}")
+                    content.append(f"  Filename: {_escape(sample['Filename'])}")
                 if sample.get('SHA256'):
-                    content.append(f"  SHA256: {sample['SHA256']}")
+                    content.append(f"  SHA256: {_escape(sample['SHA256'])}")
                 if sample.get('MD5'):
-                    content.append(f"  MD5: {sample['MD5']}")
+                    content.append(f"  MD5: {_escape(sample['MD5'])}")
                 if sample.get('SHA1'):
-                    content.append(f"  SHA1: {sample['SHA1']}")
+                    content.append(f"  SHA1: {_escape(sample['SHA1'])}")
                 if sample.get('Company'):
-                    content.append(f"  Company: {sample['Company']}")
+                    content.append(f"  Company: {_escape(sample['Company'])}")
                 if sample.get('Publisher'):
-                    content.append(f"  Publisher: {sample['Publisher']}")
+                    content.append(f"  Publisher: {_escape(sample['Publisher'])}")
                 if sample.get('Product'):
-                    content.append(f"  Product: {sample['Product']}")
+                    content.append(f"  Product: {_escape(sample['Product'])}")
                 if sample.get('FileVersion'):
-                    content.append(f"  File Version: {sample['FileVersion']}")
+                    content.append(f"  File Version: {_escape(sample['FileVersion'])}")
                 if sample.get('ProductVersion'):
-                    content.append(f"  Product Version: {sample['ProductVersion']}")
+                    content.append(f"  Product Version: {_escape(sample['ProductVersion'])}")
                 if sample.get('MachineType'):
-                    content.append(f"  Machine Type: {sample['MachineType']}")
+                    content.append(f"  Machine Type: {_escape(sample['MachineType'])}")
                 if sample.get('CreationTimestamp'):
-                    content.append(f"  Creation Timestamp: {sample['CreationTimestamp']}")
+                    content.append(f"  Creation Timestamp: {_escape(sample['CreationTimestamp'])}")
                 if sample.get('Signature'):
-                    content.append(f"  Signature: {sample['Signature']}")
+                    content.append(f"  Signature: {_escape(sample['Signature'])}")
                 if sample.get('LoadsDespiteHVCI'):
-                    content.append(f"  Loads Despite HVCI: {sample['LoadsDespiteHVCI']}")
+                    content.append(f"  Loads Despite HVCI: {_escape(sample['LoadsDespiteHVCI'])}")
                 if sample.get('Imphash'):
-                    content.append(f"  Imphash: {sample['Imphash']}")
+                    content.append(f"  Imphash: {_escape(sample['Imphash'])}")
                 if sample.get('Authentihash'):
                     auth_hash = sample.get('Authentihash', {})
                     if isinstance(auth_hash, dict):
                         if auth_hash.get('SHA256'):
-                            content.append(f"  Authentihash SHA256: {auth_hash['SHA256']}")
+                            content.append(f"  Authentihash SHA256: {_escape(auth_hash['SHA256'])}")
             content.append("")
         content.append("")
-    if item_data.get('detection'):
+    detection = get('detection')
+    if detection:
         content.append("DETECTION RULES:")
-        content.append("-" * 40)
-        for i, det in enumerate(item_data['detection'], 1):
+        content.append(DIALOG_SECTION_RULE)
+        for i, det in enumerate(detection, 1):
             content.append(f"Rule {i}:")
             if isinstance(det, dict):
                 for key, value in det.items():
-                    content.append(f"  {key}: {value}")
+                    content.append(f"  {_escape(key)}: {_escape(value)}")
             else:
-                content.append(f"  {det}")
+                content.append(f"  {_escape(det)}")
             content.append("")
         content.append("")
-    if item_data.get('resources'):
+    resources = get('resources')
+    if resources:
         content.append("RESOURCES:")
-        content.append("-" * 40)
-        for i, res in enumerate(item_data['resources'], 1):
+        content.append(DIALOG_SECTION_RULE)
+        for i, res in enumerate(resources, 1):
             if isinstance(res, dict):
-                content.append(f"  {i}. {res.get('Link', 'N/A')}")
+                content.append(f"  {i}. {_escape(res.get('Link', 'N/A'))}")
             else:
-                content.append(f"  {i}. {res}")
+                content.append(f"  {i}. {_escape(res)}")
         content.append("")
-    ack = item_data.get('acknowledgement', {})
+    ack = get('acknowledgement', {})
     if ack and isinstance(ack, dict):
         person = ack.get('Person', '')
         handle = ack.get('Handle', '')
         if person or handle:
             content.append("ACKNOWLEDGEMENTS:")
-            content.append("-" * 40)
+            content.append(DIALOG_SECTION_RULE)
             if person:
-                content.append(f"  Person: {person}")
+                content.append(f"  Person: {_escape(person)}")
             if handle:
-                content.append(f"  Handle: {handle}")
+                content.append(f"  Handle: {_escape(handle)}")
             content.append("")
     
-    content.append("=" * 80)
-    html_content = "\n".join(content).replace("\n", "<br>")
-    text_area.setHtml(f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>{html_content}</pre>")
+    content.append(DIALOG_RULE)
+    html_content = "\n".join(content)
+    text_area.setHtml(_detail_pre(html_content))
     layout.addWidget(text_area)
     
     close_button = QPushButton("Close")
@@ -247,6 +369,138 @@ def show_detailed_view(parent, item_data):
     
     detail_dialog.exec()
 
+
+def _detail_pre(body):
+    """Wrap detail lines in the monospace <pre> block used by both detail panes.
+
+    Lines are newline-separated rather than <br>-separated: inside <pre> each newline starts a
+    new QTextBlock, so Qt lays the document out block by block instead of as one huge block.
+    """
+    return f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>{body}</pre>"
+
+
+def _render_driver_html(item_data):
+    """Detail view HTML for one driver, rendered once and kept on the dict for later selections."""
+    rendered = item_data.get("_rendered_html")
+    if rendered is not None:
+        return rendered
+    get = item_data.get
+    driver_name = get("name", "N/A")
+    content = []
+    content.append(DETAIL_TOP_BORDER)
+    name_padding = max(0, DETAIL_LINE_WIDTH - (len(driver_name) + 2))
+    content.append(f"║  <b>{_escape(driver_name)}</b>" + " " * name_padding + "║")
+    content.append(DETAIL_BOTTOM_BORDER)
+    content.append("")
+    content.append("┌─ <b>Basic Information</b>")
+    for key, label in BASIC_FIELDS:
+        value = get(key)
+        if value:
+            content.append(f"│  {label}: {_escape(value)}")
+    tags = get('tags')
+    if tags:
+        content.append(f"│  Tags: {_escape(', '.join(tags))}")
+    content.append(DETAIL_SECTION_END)
+    content.append("")
+    commands_obj = get('commands', {})
+    if commands_obj and isinstance(commands_obj, dict):
+        content.append("┌─ <b>Commands</b>")
+        content.append(f"│  ┌─ <span style='color: red; font-weight: bold;'>Command:</span> {_escape(commands_obj.get('Command', 'N/A'))}")
+        content.extend(_branch_lines(_field_rows(commands_obj, COMMAND_FIELDS)))
+        content.append(DETAIL_SECTION_END)
+        content.append("")
+    samples = get('known_vulnerable_samples', [])
+    if samples:
+        content.append("┌─ <b>Known Vulnerable Samples</b>")
+        for i, sample in enumerate(samples[:DETAIL_SAMPLE_LIMIT], 1):
+            content.append(f"│")
+            content.append(f"│  [{i}] Sample Details:")
+            if isinstance(sample, dict):
+                if sample.get('Filename'):
+                    content.append(f"│  ┌─ Filename: {_escape(sample['Filename'])}")
+                content.extend(_branch_lines(_field_rows(sample, SAMPLE_FIELDS)))
+        if len(samples) > DETAIL_SAMPLE_LIMIT:
+            content.append(f"│")
+            content.append(f"│  ... {len(samples) - DETAIL_SAMPLE_LIMIT} more samples (double-click the driver to view all)")
+        content.append(DETAIL_SECTION_END)
+        content.append("")
+    detection = get('detection')
+    if detection:
+        content.append("┌─ <b>Detection Rules</b>")
+        for i, det in enumerate(detection, 1):
+            content.append(f"│")
+            content.append(f"│  [{i}] Rule Details:")
+            if isinstance(det, dict):
+                for key, value in det.items():
+                    content.append(f"│    • {_escape(key)}: {_escape(value)}")
+            else:
+                content.append(f"│    • {_escape(det)}")
+        content.append(DETAIL_SECTION_END)
+        content.append("")
+    resources = get('resources')
+    if resources:
+        content.append("┌─ <b>Resources</b>")
+        for i, res in enumerate(resources, 1):
+            if isinstance(res, dict):
+                link = res.get('Link', str(res))
+            else:
+                link = str(res)
+            content.append(f"│  {i}. {_escape(link)}")
+        content.append(DETAIL_SECTION_END)
+        content.append("")
+    ack = get('acknowledgement', {})
+    if ack and isinstance(ack, dict):
+        person = ack.get('Person', '')
+        handle = ack.get('Handle', '')
+        if person or handle:
+            content.append("┌─ <b>Acknowledgements</b>")
+            if person:
+                content.append(f"│  • Person: {_escape(person)}")
+            if handle:
+                content.append(f"│    Handle: {_escape(handle)}")
+            content.append(DETAIL_SECTION_END)
+            content.append("")
+    rendered = _detail_pre("\n".join(content))
+    item_data["_rendered_html"] = rendered
+    return rendered
+
+
+class LOLDriversFilterProxyModel(QSortFilterProxyModel):
+    """Filters the static driver list by name/hash search without rebuilding the source model."""
+
+    def __init__(self, drivers=(), parent=None):
+        super().__init__(parent)
+        self._drivers = drivers
+        self._search_lower = ""
+
+    def set_drivers(self, drivers):
+        """Rows of the source model map to this list by index; set it before the rows are inserted."""
+        self._drivers = drivers
+
+    def driver_at(self, index):
+        """Driver dict behind a proxy index, or None."""
+        if not index.isValid():
+            return None
+        row = self.mapToSource(index).row()
+        if 0 <= row < len(self._drivers):
+            return self._drivers[row]
+        return None
+
+    def set_search(self, search_text=""):
+        """Apply the search; returns False without re-filtering when it is unchanged."""
+        search_lower = search_text.strip().lower() if search_text else ""
+        if search_lower == self._search_lower:
+            return False
+        self._search_lower = search_lower
+        self.invalidateRowsFilter()
+        return True
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return not self._search_lower or self._search_lower in self._drivers[source_row]['_search_blob']
+
+
+LOLDRIVERS_LOAD = BackgroundLoad(load_loldrivers_data)
+
 NO_DATA_MSG = "No data found. Please click 'Download Updates' to download the latest files."
 
 
@@ -256,8 +510,7 @@ def display_loldrivers_kb(parent, db_path):
         LOLDRIVERS_WINDOW.activateWindow()
         LOLDRIVERS_WINDOW.raise_()
         return LOLDRIVERS_WINDOW
-    data = load_loldrivers_data()
-    if not data:
+    if LOLDRIVERS_DATA_CACHE is not None and not LOLDRIVERS_DATA_CACHE:
         QMessageBox.information(parent.window, "No Data", NO_DATA_MSG)
         return None
     kb_window = QWidget(parent.window)
@@ -313,7 +566,10 @@ def display_loldrivers_kb(parent, db_path):
     
     model = QStandardItemModel()
     model.setHorizontalHeaderLabels(["Name"])
-    tree_view.setModel(model)
+    proxy_model = LOLDriversFilterProxyModel(parent=kb_window)
+    proxy_model.setSourceModel(model)
+    tree_view.setModel(proxy_model)
+    tree_view.sortByColumn(0, Qt.AscendingOrder)
     tree_view.setColumnWidth(0, 300)
     
     splitter.addWidget(tree_view)
@@ -321,7 +577,7 @@ def display_loldrivers_kb(parent, db_path):
     detail_view.setReadOnly(True)
     detail_view.setFont(QFont("Consolas", 10) or QFont("Courier New", 10))
     detail_view.setStyleSheet(styles.DETAIL_VIEW_KB_STYLE)
-    detail_view.setPlaceholderText("Select a driver to view details...")
+    detail_view.setPlaceholderText("Loading drivers...")
     splitter.addWidget(detail_view)
     
     splitter.setStretchFactor(0, 1)
@@ -339,274 +595,71 @@ def display_loldrivers_kb(parent, db_path):
     footer_layout.addStretch()
     main_layout.addLayout(footer_layout)
     
-    full_data_store = []
-    
-    def filter_drivers(search_term=""):
-        filtered = []
+    def populate_tree():
+        if LOLDRIVERS_WINDOW is not kb_window:
+            return
+        data = LOLDRIVERS_DATA_CACHE or []
+        if not data:
+            QMessageBox.information(kb_window, "No Data", NO_DATA_MSG)
+            kb_window.close()
+            return
         try:
-            drivers_data = load_loldrivers_data()
-            if not drivers_data:
-                return []
-            
-            if not search_term.strip():
-                return drivers_data
-            search_lower = search_term.strip().lower()
-            for item in drivers_data:
-                name_match = search_lower in item.get("name", "").lower()
-                hash_match = False
-                samples = item.get('known_vulnerable_samples', [])
-                for sample in samples:
-                    if isinstance(sample, dict):
-                        if sample.get('SHA256') and search_lower in sample.get('SHA256', '').lower():
-                            hash_match = True
-                            break
-                        if sample.get('SHA1') and search_lower in sample.get('SHA1', '').lower():
-                            hash_match = True
-                            break
-                        if sample.get('MD5') and search_lower in sample.get('MD5', '').lower():
-                            hash_match = True
-                            break
-                        auth_hash = sample.get('Authentihash', {})
-                        if isinstance(auth_hash, dict):
-                            if auth_hash.get('SHA256') and search_lower in auth_hash.get('SHA256', '').lower():
-                                hash_match = True
-                                break
-                            if auth_hash.get('SHA1') and search_lower in auth_hash.get('SHA1', '').lower():
-                                hash_match = True
-                                break
-                            if auth_hash.get('MD5') and search_lower in auth_hash.get('MD5', '').lower():
-                                hash_match = True
-                                break
-                
-                if name_match or hash_match:
-                    filtered.append(item)
-        except Exception as e:
-            logger.error("Error filtering drivers: %s", e)
-        return filtered
-    
-    def populate_tree(search_term=""):
-        nonlocal full_data_store
-        model.removeRows(0, model.rowCount())
-        full_data_store.clear()
-        
-        try:
-            filtered_data = filter_drivers(search_term)
-            
-            if not filtered_data:
-                if not load_loldrivers_data():
-                    QMessageBox.information(kb_window, "No LOLDrivers Data", 
-                        "No LOLDrivers data found. Please ensure the data/microsoft/drivers.json file exists.")
-                return
-            
-            for item in sorted(filtered_data, key=lambda x: x.get('name', '')):
-                name = str(item.get('name', ''))
-                tree_item = QStandardItem(name)
-                model.appendRow(tree_item)
-                full_data_store.append(item)
-            
-            logger.info("Displayed %s drivers, stored %s items for detailed view", len(filtered_data), len(full_data_store))
+            proxy_model.set_drivers(data)
+            items = [QStandardItem(str(item['name'])) for item in data]
+            tree_view.setUpdatesEnabled(False)
+            model.invisibleRootItem().appendRows(items)
+            tree_view.setUpdatesEnabled(True)
+            logger.info("Displayed %s drivers", len(data))
         except Exception as e:
             logger.error("Error populating tree: %s", e)
             QMessageBox.critical(kb_window, "Error", f"Failed to populate data: {e}")
+        detail_view.setPlaceholderText("Select a driver to view details...")
     
     def search_tools():
-        search_term = search_textbox.text()
-        populate_tree(search_term)
+        try:
+            if proxy_model.set_search(search_textbox.text()):
+                logger.info("Displayed %s drivers", proxy_model.rowCount())
+        except Exception as e:
+            logger.error("Error filtering drivers: %s", e)
     
-    def on_item_selected(index):
+    def show_current_driver():
         try:
-            row = index.row()
-            if 0 <= row < len(full_data_store):
-                item_data = full_data_store[row]
-                driver_name = item_data.get("name", "N/A")
-                content = []
-                content.append("╔" + "═" * DETAIL_LINE_WIDTH + "╗")
-                name_padding = max(0, DETAIL_LINE_WIDTH - (len(driver_name) + 2))
-                content.append(f"║  <b>{driver_name}</b>" + " " * name_padding + "║")
-                content.append("╚" + "═" * DETAIL_LINE_WIDTH + "╝")
-                content.append("")
-                content.append("┌─ <b>Basic Information</b>")
-                if item_data.get('category'):
-                    content.append(f"│  Category: {item_data['category']}")
-                if item_data.get('verified'):
-                    content.append(f"│  Verified: {item_data['verified']}")
-                if item_data.get('author'):
-                    content.append(f"│  Author: {item_data['author']}")
-                if item_data.get('created'):
-                    content.append(f"│  Created: {item_data['created']}")
-                if item_data.get('mitre_id'):
-                    content.append(f"│  MITRE ID: {item_data['mitre_id']}")
-                if item_data.get('tags'):
-                    content.append(f"│  Tags: {', '.join(item_data['tags'])}")
-                content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                content.append("")
-                commands_obj = item_data.get('commands', {})
-                if commands_obj and isinstance(commands_obj, dict):
-                    content.append("┌─ <b>Commands</b>")
-                    content.append(f"│  ┌─ <span style='color: red; font-weight: bold;'>Command:</span> {commands_obj.get('Command', 'N/A')}")
-                    
-                    has_desc = bool(commands_obj.get('Description'))
-                    has_usecase = bool(commands_obj.get('Usecase'))
-                    has_privileges = bool(commands_obj.get('Privileges'))
-                    has_os = bool(commands_obj.get('OperatingSystem'))
-                    
-                    has_any = has_desc or has_usecase or has_privileges or has_os
-                    
-                    if has_desc:
-                        connector = "├" if (has_usecase or has_privileges or has_os) else "└"
-                        content.append(f"│  {connector}─ Description: {commands_obj['Description']}")
-                    
-                    if has_usecase:
-                        connector = "├" if (has_privileges or has_os) else "└"
-                        content.append(f"│  {connector}─ Usecase: {commands_obj['Usecase']}")
-                    
-                    if has_privileges:
-                        connector = "├" if has_os else "└"
-                        content.append(f"│  {connector}─ Privileges: {commands_obj['Privileges']}")
-                    
-                    if has_os:
-                        content.append(f"│  └─ Operating System: {commands_obj['OperatingSystem']}")
-                    elif not has_any:
-                        content.append(f"│  └")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                samples = item_data.get('known_vulnerable_samples', [])
-                if samples:
-                    content.append("┌─ <b>Known Vulnerable Samples</b>")
-                    for i, sample in enumerate(samples, 1):
-                        content.append(f"│")
-                        content.append(f"│  [{i}] Sample Details:")
-                        if isinstance(sample, dict):
-                            if sample.get('Filename'):
-                                content.append(f"│  ┌─ Filename: {sample['Filename']}")
-                            
-                            has_sha256 = bool(sample.get('SHA256'))
-                            has_md5 = bool(sample.get('MD5'))
-                            has_sha1 = bool(sample.get('SHA1'))
-                            has_company = bool(sample.get('Company'))
-                            has_publisher = bool(sample.get('Publisher'))
-                            has_product = bool(sample.get('Product'))
-                            has_version = bool(sample.get('FileVersion') or sample.get('ProductVersion'))
-                            has_machine = bool(sample.get('MachineType'))
-                            has_timestamp = bool(sample.get('CreationTimestamp'))
-                            has_signature = bool(sample.get('Signature'))
-                            has_hvci = bool(sample.get('LoadsDespiteHVCI'))
-                            has_imphash = bool(sample.get('Imphash'))
-                            
-                            has_any = has_sha256 or has_md5 or has_sha1 or has_company or has_publisher or has_product or has_version or has_machine or has_timestamp or has_signature or has_hvci or has_imphash
-                            
-                            if has_sha256:
-                                connector = "├" if (has_md5 or has_sha1 or has_company or has_publisher or has_product or has_version or has_machine or has_timestamp or has_signature or has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ SHA256: {sample['SHA256']}")
-                            
-                            if has_md5:
-                                connector = "├" if (has_sha1 or has_company or has_publisher or has_product or has_version or has_machine or has_timestamp or has_signature or has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ MD5: {sample['MD5']}")
-                            
-                            if has_sha1:
-                                connector = "├" if (has_company or has_publisher or has_product or has_version or has_machine or has_timestamp or has_signature or has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ SHA1: {sample['SHA1']}")
-                            
-                            if has_company:
-                                connector = "├" if (has_publisher or has_product or has_version or has_machine or has_timestamp or has_signature or has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ Company: {sample['Company']}")
-                            
-                            if has_publisher:
-                                connector = "├" if (has_product or has_version or has_machine or has_timestamp or has_signature or has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ Publisher: {sample['Publisher']}")
-                            
-                            if has_product:
-                                connector = "├" if (has_version or has_machine or has_timestamp or has_signature or has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ Product: {sample['Product']}")
-                            
-                            if has_version:
-                                connector = "├" if (has_machine or has_timestamp or has_signature or has_hvci or has_imphash) else "└"
-                                version_info = []
-                                if sample.get('FileVersion'):
-                                    version_info.append(f"File: {sample['FileVersion']}")
-                                if sample.get('ProductVersion'):
-                                    version_info.append(f"Product: {sample['ProductVersion']}")
-                                content.append(f"│  {connector}─ Version: {', '.join(version_info)}")
-                            
-                            if has_machine:
-                                connector = "├" if (has_timestamp or has_signature or has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ Machine Type: {sample['MachineType']}")
-                            
-                            if has_timestamp:
-                                connector = "├" if (has_signature or has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ Creation Timestamp: {sample['CreationTimestamp']}")
-                            
-                            if has_signature:
-                                connector = "├" if (has_hvci or has_imphash) else "└"
-                                content.append(f"│  {connector}─ Signature: {sample['Signature']}")
-                            
-                            if has_hvci:
-                                connector = "├" if has_imphash else "└"
-                                content.append(f"│  {connector}─ Loads Despite HVCI: {sample['LoadsDespiteHVCI']}")
-                            
-                            if has_imphash:
-                                content.append(f"│  └─ Imphash: {sample['Imphash']}")
-                            elif not has_any:
-                                content.append(f"│  └")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                if item_data.get('detection'):
-                    content.append("┌─ <b>Detection Rules</b>")
-                    for i, det in enumerate(item_data['detection'], 1):
-                        content.append(f"│")
-                        content.append(f"│  [{i}] Rule Details:")
-                        if isinstance(det, dict):
-                            for key, value in det.items():
-                                content.append(f"│    • {key}: {value}")
-                        else:
-                            content.append(f"│    • {det}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                if item_data.get('resources'):
-                    content.append("┌─ <b>Resources</b>")
-                    for i, res in enumerate(item_data['resources'], 1):
-                        if isinstance(res, dict):
-                            link = res.get('Link', str(res))
-                        else:
-                            link = str(res)
-                        content.append(f"│  {i}. {link}")
-                    content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                    content.append("")
-                ack = item_data.get('acknowledgement', {})
-                if ack and isinstance(ack, dict):
-                    person = ack.get('Person', '')
-                    handle = ack.get('Handle', '')
-                    if person or handle:
-                        content.append("┌─ <b>Acknowledgements</b>")
-                        if person:
-                            content.append(f"│  • Person: {person}")
-                        if handle:
-                            content.append(f"│    Handle: {handle}")
-                        content.append("└" + "─" * DETAIL_BORDER_WIDTH)
-                        content.append("")
-                html_content = "\n".join(content).replace("\n", "<br>")
-                detail_view.setHtml(f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>{html_content}</pre>")
+            item_data = proxy_model.driver_at(tree_view.currentIndex())
+            if item_data is not None:
+                detail_view.setHtml(_render_driver_html(item_data))
             else:
                 detail_view.clear()
         except Exception as e:
             logger.error("Error in selection handler: %s", e)
-            detail_view.setHtml(f"<pre style='font-family: {styles.FONT_KB_MONOSPACE};'>Error loading driver details: {e}</pre>")
+            detail_view.setHtml(_detail_pre(f"Error loading driver details: {_escape(e)}"))
     
     def on_item_double_clicked(index):
         try:
-            row = index.row()
-            if 0 <= row < len(full_data_store):
-                item_data = full_data_store[row]
+            item_data = proxy_model.driver_at(index)
+            if item_data is not None:
                 show_detailed_view(kb_window, item_data)
         except Exception as e:
             logger.error("Error in double-click handler: %s", e)
             QMessageBox.warning(kb_window, "Error", f"Failed to open detailed view: {e}")
     
-    tree_view.selectionModel().currentChanged.connect(on_item_selected)
+    # Arrow-key scrolling moves the current row faster than the pane can lay out HTML, so only
+    # the row the user settles on is rendered.
+    detail_debounce = QTimer(kb_window)
+    detail_debounce.setSingleShot(True)
+    detail_debounce.setInterval(DETAIL_DEBOUNCE_MS)
+    detail_debounce.timeout.connect(show_current_driver)
+    tree_view.selectionModel().currentChanged.connect(lambda _current, _previous: detail_debounce.start())
     tree_view.doubleClicked.connect(on_item_double_clicked)
-    search_textbox.textChanged.connect(search_tools)
-    populate_tree("")
+    search_debounce = QTimer(kb_window)
+    search_debounce.setSingleShot(True)
+    search_debounce.setInterval(SEARCH_DEBOUNCE_MS)
+    search_debounce.timeout.connect(search_tools)
+    search_textbox.textChanged.connect(lambda _text: search_debounce.start())
     
+    if LOLDRIVERS_DATA_CACHE is not None:
+        populate_tree()
+    else:
+        LOLDRIVERS_LOAD.when_loaded(kb_window, populate_tree)
     kb_window.show()
     return kb_window
 
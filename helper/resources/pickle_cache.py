@@ -0,0 +1,52 @@
+"""
+Pickle caches for the knowledge-base loaders: parsed data is stored next to its
+source files and reused while a signature over those files still matches.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+def cache_signature(version, source_paths, base_dir):
+    """Fingerprint of the source files (paths relative to base_dir, mtimes, sizes) plus the cache layout version."""
+    entries = []
+    for path in source_paths:
+        st = os.stat(path)
+        entries.append((os.path.relpath(path, base_dir), st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return hashlib.blake2b(repr((version, entries)).encode("utf-8")).hexdigest()
+
+
+def read_cache(cache_path, signature):
+    """Cached data when cache_path exists and was written for signature, else None."""
+    try:
+        with open(cache_path, "rb") as fp:
+            cached = pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable cache %s: %s", cache_path, e)
+        return None
+    if not isinstance(cached, dict) or cached.get("sig") != signature:
+        return None
+    return cached.get("data")
+
+
+def write_cache(cache_path, signature, data):
+    """Atomically replace cache_path with data; failures are logged, never raised."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), prefix=os.path.basename(cache_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump({"sig": signature, "data": data}, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.warning("Could not write cache %s: %s", cache_path, e)
@@ -0,0 +1,39 @@
+"""
+YAML parsing shared by the knowledge-base loaders (artifacts, HijackLibs).
+"""
+
+import logging
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader when PyYAML was built with it; same safe subset as yaml.safe_load.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml_documents(path, binary=False):
+    """All YAML documents in one file, streamed through a single parser; [] if the file cannot be read.
+
+    With binary=True the file is handed over as bytes so libyaml decodes UTF-8 itself
+    instead of pulling text through Python's decoder chunk by chunk.
+    """
+    try:
+        with (open(path, "rb") if binary else open(path, "r", encoding="utf-8")) as fp:
+            try:
+                return list(yaml.load_all(fp, Loader=YAML_LOADER))
+            except yaml.YAMLError as e:
+                logger.warning("YAML parse error in %s, loading its documents one by one: %s", path, e)
+            fp.seek(0)
+            content = fp.read()
+    except Exception as e:
+        logger.error("Error loading %s: %s", path, e)
+        return []
+    # A broken document ends the stream, so fall back to per-document parsing to keep the rest of the file.
+    documents = []
+    for doc in content.split(b"\n---" if binary else "\n---"):
+        try:
+            documents.append(yaml.load(doc, Loader=YAML_LOADER))
+        except yaml.YAMLError as e:
+            logger.error("YAML parse error in %s: %s", path, e)
+    return documents
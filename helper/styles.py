@@ -240,6 +240,7 @@ BUTTON_CLEAR_MINIMAL = "padding: 4px 12px;"
 # Report Builder
 LABEL_INFO_ITALIC_10PT = "color: #666; font-style: italic; font-size: 10pt;"
 LABEL_BOLD = "font-weight: bold;"
+COLOR_PREVIEW_STYLE = "background-color: {c}; border: 1px solid #ccc; border-radius: 4px;"
 
 # Mapping Defend
 LABEL_TECH_TITLE_BLUE = "color: #0077b6;"
@@ -409,6 +410,13 @@ DETAIL_VIEW_KB_STYLE = """
     }
 """
 FONT_KB_MONOSPACE = "Consolas, Courier New, Monaco, Menlo, DejaVu Sans Mono, Liberation Mono, monospace"
+# Rich-text detail panes (inline CSS, Qt's HTML subset)
+KB_DETAIL_H2_STYLE = "color: #24292e; margin: 0 0 8px 0;"
+KB_DETAIL_H3_STYLE = "color: #0366d6; margin: 14px 0 4px 0;"
+KB_DETAIL_SOURCE_STYLE = "font-weight: bold; margin: 8px 0 2px 0;"
+KB_DETAIL_TABLE_STYLE = "border: 1px solid #e1e4e8; border-collapse: collapse;"
+KB_DETAIL_TH_STYLE = "background-color: #f6f8fa; padding: 4px 8px; text-align: left; vertical-align: top; border: 1px solid #e1e4e8;"
+KB_DETAIL_TD_STYLE = "padding: 4px 8px; vertical-align: top; border: 1px solid #e1e4e8;"
 
 # Event ID / resources_data tree (distinct style with gradient)
 TREE_VIEW_EVENT_ID_STYLE = """